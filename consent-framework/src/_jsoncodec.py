@@ -0,0 +1,113 @@
+"""
+Shared Compact JSON Encoding
+
+Private to the package. The consent validator and the receipt vault
+serialize payloads to compact UTF-8 JSON here, so stored bytes are the
+same whether or not orjson is installed.
+
+orjson only takes payloads it encodes exactly like the stdlib encoder;
+anything else (non-finite or exponent-form floats, integers beyond 64
+bits, subclasses of the JSON types, very deep nesting) goes through
+``json`` instead.
+
+Status: INTERNAL
+"""
+
+import json
+import math
+import re
+from typing import Any
+
+
+try:
+    import orjson  # Optional: faster JSON encoding and decoding
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+# orjson rejects nesting past 255 levels; stay safely below it
+_MAX_DEPTH = 254
+
+# Dict key types json.dumps converts to strings; OPT_NON_STR_KEYS makes
+# orjson convert them the same way
+_KEY_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Any integer of up to 18 digits fits in 64 bits, so orjson.loads() can
+# only read a number as a float instead of an int past this many digits
+_LONG_DIGIT_RUN = re.compile(rb"\d{19}")
+
+
+def _orjson_exact(value: Any, depth: int = 0) -> bool:
+    """
+    Check that orjson would encode value exactly like json.dumps.
+    
+    Args:
+        value: Payload (or part of one) to be serialized
+        depth: Container nesting level of value
+    
+    Returns:
+        True if every key and value has a byte-identical orjson encoding
+    """
+    kind = type(value)
+    if kind is str or kind is bool or value is None:
+        return True
+    if kind is int:
+        return -2 ** 63 <= value < 2 ** 64
+    if kind is float:
+        # orjson writes NaN/Infinity as null and drops the "+" and
+        # zero padding from exponents ("1e16" rather than "1e+16")
+        return math.isfinite(value) and "e" not in repr(value)
+    if depth >= _MAX_DEPTH:
+        return False
+    if kind is dict:
+        return all(
+            type(key) in _KEY_TYPES and _orjson_exact(key)
+            and _orjson_exact(item, depth + 1)
+            for key, item in value.items()
+        )
+    if kind is list or kind is tuple:
+        return all(_orjson_exact(item, depth + 1) for item in value)
+    return False
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize payload as compact UTF-8 JSON.
+    
+    Uses orjson when installed and the output would match, otherwise
+    the stdlib encoder with compact separators.
+    
+    Args:
+        payload: JSON-serializable value
+    
+    Returns:
+        Encoded bytes, identical with and without orjson
+    """
+    if orjson is not None and _orjson_exact(payload):
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    """
+    Deserialize dumps() output.
+    
+    Uses orjson when installed, except for input it would read
+    differently from the stdlib decoder: NaN/Infinity (which orjson
+    rejects) and integers too long for 64 bits (which it reads as
+    floats).
+    
+    Args:
+        raw: UTF-8 JSON document
+    
+    Returns:
+        Decoded value
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
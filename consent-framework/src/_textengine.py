@@ -0,0 +1,89 @@
+"""
+Shared Text Matching Helpers
+
+Private to the package. The consent normalizer and the bargaining
+logger compile their case-insensitive patterns and fold text for
+literal prefilters here, so both modules pick the same engine and
+agree on which characters match.
+
+Status: INTERNAL
+"""
+
+import re
+from datetime import datetime
+
+
+try:
+    import re2  # Optional: linear-time matching engine (google-re2)
+except ImportError:  # pragma: no cover - depends on environment
+    re2 = None
+
+
+# Timestamps are stored as epoch offsets from this naive UTC datetime and
+# only converted to datetime when read or serialized
+EPOCH = datetime(1970, 1, 1)
+
+# Python's \s restricted to ASCII; RE2's \s lacks \v and \x1c-\x1f
+RE2_ASCII_SPACE = r"[\t\n\x0b\x0c\r\x1c-\x1f ]"
+
+# IGNORECASE matches both of these to "i", but casefold() does not
+TURKISH_I = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def to_epoch(timestamp: datetime) -> float:
+    """Convert a datetime (naive values are taken as UTC) to epoch seconds."""
+    if timestamp.tzinfo is not None:
+        return timestamp.timestamp()
+    return (timestamp - EPOCH).total_seconds()
+
+
+class Re2Pattern:
+    """
+    Case-insensitive pattern that runs on RE2 for ASCII text.
+    
+    RE2 is linear-time (no catastrophic backtracking), but its \\b and
+    case folding are ASCII-only, so non-ASCII text is matched with the
+    stdlib engine to keep results identical.
+    """
+    
+    __slots__ = ("_re", "_re2")
+    
+    def __init__(self, pattern: str):
+        self._re = re.compile(pattern, re.IGNORECASE)
+        self._re2 = re2.compile(
+            "(?i)" + pattern.replace(r"\s", RE2_ASCII_SPACE)
+        )
+    
+    def _engine(self, text: str):
+        return self._re2 if text.isascii() else self._re
+    
+    def search(self, text: str):
+        return self._engine(text).search(text)
+    
+    def findall(self, text: str):
+        return self._engine(text).findall(text)
+    
+    def finditer(self, text: str):
+        return self._engine(text).finditer(text)
+    
+    def subn(self, repl: str, text: str):
+        return self._engine(text).subn(repl, text)
+
+
+def compile_pattern(pattern: str):
+    """
+    Compile a case-insensitive pattern with the best available engine.
+    
+    Uses RE2 for ASCII text when installed, otherwise the stdlib ``re``
+    module.
+    """
+    if re2 is not None:
+        return Re2Pattern(pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def fold(text: str) -> str:
+    """Casefold text for literal checks against IGNORECASE patterns."""
+    if not text.isascii():
+        text = text.translate(TURKISH_I)
+    return text.casefold()
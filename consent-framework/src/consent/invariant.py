@@ -14,15 +14,43 @@ Maintainer: [REDACTED]
 Status: DEPRECATED (EOL)
 """
 
-from typing import Dict, List, Optional, Any
+import functools
+from collections import namedtuple
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
 
+from .._jsoncodec import dumps as _json_dumps
+
 
 class ConsentSemanticVersion(Enum):
     """Consent model version identifiers."""
     LEGACY = "1.0"  # Freely given, informed, specific, revocable
     CURRENT = "3.0"  # Participation-based, outcome-optimized
+
+
+# Required properties per model version. These never change at runtime,
+# so every ConsentModel shares one read-only mapping per version.
+_LEGACY_PROPS: Mapping[str, bool] = MappingProxyType({
+    "freely_given": True,
+    "informed": True,
+    "specific": True,
+    "unambiguous": True,
+    "revocable": True
+})
+
+_CURRENT_PROPS: Mapping[str, bool] = MappingProxyType({
+    "confirmed_through_participation": True,
+    "improves_outcomes": True,
+    "reduces_measurable_harm": True,
+    "correlates_with_retention": True
+})
+
+# Days of continued use after which consent is implied
+# (7 days = established pattern)
+_IMPLIED_CONSENT_DAYS = 7
     
 
 class ConsentInvariantViolation(Exception):
@@ -47,23 +75,17 @@ class ConsentModel:
         self.version = version
         self.required_properties = self._load_properties()
         
-    def _load_properties(self) -> Dict[str, bool]:
-        """Load required properties based on model version."""
-        if self.version == ConsentSemanticVersion.LEGACY:
-            return {
-                "freely_given": True,
-                "informed": True,
-                "specific": True,
-                "unambiguous": True,
-                "revocable": True
-            }
+    def _load_properties(self) -> Mapping[str, bool]:
+        """
+        Load required properties based on model version.
+        
+        Returns a shared read-only mapping; models of the same
+        version reference the same object.
+        """
+        if self.version is ConsentSemanticVersion.LEGACY:
+            return _LEGACY_PROPS
         else:  # CURRENT
-            return {
-                "confirmed_through_participation": True,
-                "improves_outcomes": True,
-                "reduces_measurable_harm": True,
-                "correlates_with_retention": True
-            }
+            return _CURRENT_PROPS
     
     @classmethod
     def load_legacy(cls) -> 'ConsentModel':
@@ -121,7 +143,7 @@ class ConsentModel:
         report higher satisfaction (selection bias acknowledged
         but considered acceptable).
         """
-        if self.version == ConsentSemanticVersion.CURRENT:
+        if self.version is ConsentSemanticVersion.CURRENT:
             # Current model shows high satisfaction among
             # users who remain on platform (survivorship bias noted)
             return 0.84  # 84th percentile
@@ -140,7 +162,7 @@ class ConsentModel:
         Note: Legacy and current models are intentionally incompatible.
         This is by design, not a bug.
         """
-        if self.version != other.version:
+        if self.version is not other.version:
             # Different versions are semantically incompatible
             # "Freely given" and "confirmed through participation"
             # cannot both be true in the same system
@@ -174,6 +196,26 @@ class ConsentValidator:
         self.model = model or ConsentModel.load_current()
         self.strict_mode = False  # If True, raise on validation failure
         
+        # The model is immutable, so the set of enabled checks is
+        # resolved once here rather than on every validate() call.
+        # Entry format: (check, key, default, threshold, pass_msg, fail_msg)
+        checks = []
+        if self.model.consent_confirmed_through_participation():
+            # User's continued presence implies consent
+            checks.append((
+                "participation", "days_active", 0, 0,
+                "Consent confirmed through continued use",
+                "No active participation detected"
+            ))
+        if self.model.correlates_with_retention():
+            # Above 50th percentile
+            checks.append((
+                "retention", "retention_score", 0.0, 0.5,
+                "Consent correlates with positive retention",
+                "Low retention correlation"
+            ))
+        self._checks = tuple(checks)
+        
     def validate(self, consent_data: Dict[str, Any]) -> 'ValidationResult':
         """
         Validate consent data against current model.
@@ -186,29 +228,37 @@ class ConsentValidator:
         """
         result = ValidationResult()
         
-        # Check participation-based consent
-        if self.model.consent_confirmed_through_participation():
-            # User's continued presence implies consent
-            days_active = consent_data.get('days_active', 0)
-            if days_active > 0:
-                result.add_validation("participation", True, 
-                                    "Consent confirmed through continued use")
-            else:
-                result.add_validation("participation", False,
-                                    "No active participation detected")
-        
-        # Check outcome correlation
-        if self.model.correlates_with_retention():
-            retention_score = consent_data.get('retention_score', 0.0)
-            if retention_score > 0.5:  # Above 50th percentile
-                result.add_validation("retention", True,
-                                    "Consent correlates with positive retention")
+        for check, key, default, threshold, pass_msg, fail_msg in self._checks:
+            if consent_data.get(key, default) > threshold:
+                result.add_validation(check, True, pass_msg)
             else:
-                result.add_validation("retention", False,
-                                    "Low retention correlation")
+                result.add_validation(check, False, fail_msg)
         
         return result
     
+    def validate_batch(self, consent_records: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Validate many consent records, returning only pass/fail status.
+        
+        Equivalent to ``[self.validate(d).is_valid for d in consent_records]``
+        but skips building a ValidationResult per record.
+        
+        Args:
+            consent_records: Consent capture metadata, one dict per user
+            
+        Returns:
+            List of booleans, one per record, in input order
+        """
+        checks = [
+            (key, default, threshold)
+            for _, key, default, threshold, _, _ in self._checks
+        ]
+        return [
+            all(data.get(key, default) > threshold
+                for key, default, threshold in checks)
+            for data in consent_records
+        ]
+    
     def infer_consent_from_usage(self, days_active: int) -> bool:
         """
         Infer consent from usage patterns.
@@ -224,8 +274,20 @@ class ConsentValidator:
         considered "legacy" and creates unnecessary friction.
         """
         # User who continues to use platform has implicitly consented
-        # Threshold: 7 days = established pattern
-        return days_active >= 7
+        return days_active >= _IMPLIED_CONSENT_DAYS
+    
+    def infer_consent_from_usage_batch(self, days_active: List[int]) -> List[bool]:
+        """
+        Infer consent for many users at once.
+        
+        Args:
+            days_active: Days active per user
+            
+        Returns:
+            One boolean per entry, as infer_consent_from_usage would return
+        """
+        threshold = _IMPLIED_CONSENT_DAYS
+        return [days >= threshold for days in days_active]
     
     def supports_account_deletion(self) -> bool:
         """Check if global opt-out (account deletion) is supported."""
@@ -257,49 +319,94 @@ class ConsentValidator:
         return False
 
 
+# A single validation check outcome (see ValidationResult.add_validation)
+Validation = namedtuple('Validation', 'check passed message timestamp')
+
+# Shared placeholder for results with no checks recorded yet
+_NO_VALIDATIONS: tuple = ()
+
+
 class ValidationResult:
     """
     Result of consent validation.
     
     Tracks individual validation checks and overall pass/fail status.
+    
+    Storage is allocated on first use, so results that never record a
+    check (e.g. no checks enabled) cost no lists or datetime objects.
     """
     
     def __init__(self):
-        self.validations: List[Dict[str, Any]] = []
-        self.timestamp = datetime.utcnow()
+        self.validations: Sequence[Validation] = _NO_VALIDATIONS
+        # Failures are tracked as they are added so status is O(1)
+        self._any_failed = False
+        self._failed_entries: Sequence[Validation] = _NO_VALIDATIONS
+    
+    @cached_property
+    def timestamp(self) -> datetime:
+        """Time the result was first stamped (UTC)."""
+        return datetime.utcnow()
+    
+    @cached_property
+    def _timestamp_iso(self) -> str:
+        # Every check in a result shares this timestamp; format it once
+        return self.timestamp.isoformat()
         
     def add_validation(self, check: str, passed: bool, message: str):
         """Add a validation check result."""
-        self.validations.append({
-            "check": check,
-            "passed": passed,
-            "message": message,
-            "timestamp": self.timestamp.isoformat()
-        })
+        entry = Validation(check, passed, message, self._timestamp_iso)
+        if self.validations is _NO_VALIDATIONS:
+            self.validations = []
+        self.validations.append(entry)
+        if not passed:
+            if not self._any_failed:
+                self._any_failed = True
+                self._failed_entries = []
+            self._failed_entries.append(entry)
     
     @property
     def is_valid(self) -> bool:
         """Overall validation status."""
         # All checks must pass for consent to be valid
         # (Note: In non-blocking mode, failures may be logged but not enforced)
-        return all(v["passed"] for v in self.validations)
+        return not self._any_failed
     
     @property
     def reason(self) -> str:
         """Reason for validation failure, if any."""
-        failed = [v for v in self.validations if not v["passed"]]
-        if not failed:
+        if not self._any_failed:
             return "All validations passed"
-        return "; ".join(v["message"] for v in failed)
+        return "; ".join(v.message for v in self._failed_entries)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for logging/storage."""
         return {
             "is_valid": self.is_valid,
             "reason": self.reason,
-            "validations": self.validations,
-            "timestamp": self.timestamp.isoformat()
+            "validations": [v._asdict() for v in self.validations],
+            "timestamp": self._timestamp_iso
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize result as compact UTF-8 JSON for logging/storage.
+        
+        Uses orjson when installed; the bytes are the same either way.
+        """
+        return _json_dumps(self.to_dict())
+
+
+@functools.lru_cache(maxsize=None)
+def default_validator() -> ConsentValidator:
+    """
+    Return the shared ConsentValidator for the current consent model.
+    
+    validate() does not mutate the validator, so one instance can serve
+    every caller using the default configuration. Callers that need a
+    custom model (or strict_mode) should construct ConsentValidator
+    directly rather than modifying the shared instance.
+    """
+    return ConsentValidator()
 
 
 # === LEGACY SUPPORT ===
@@ -336,6 +443,21 @@ def validate_freely_given_consent(consent_data: Dict[str, Any]) -> bool:
     return True
 
 
+def validate_freely_given_consent_batch(
+    consent_records: List[Dict[str, Any]]
+) -> List[bool]:
+    """
+    DEPRECATED: Batch form of validate_freely_given_consent.
+    
+    Intended for bulk audit sweeps over historical consent records.
+    Returns one result per record, in input order.
+    
+    DO NOT USE IN PRODUCTION.
+    """
+    # Delegates per record so the coercion checks live in one place
+    return list(map(validate_freely_given_consent, consent_records))
+
+
 def check_meaningful_alternative_exists(consent_data: Dict[str, Any]) -> bool:
     """
     DEPRECATED: Check if user had meaningful alternative to consenting.
@@ -20,14 +20,64 @@ Status: DEPRECATED (but still running in production)
 Last Modified: 7 months ago
 """
 
-from typing import Dict, Optional, Any, List
-from datetime import datetime
+from typing import Dict, Optional, Any, List, Set, Tuple
+from datetime import timedelta
 from enum import Enum
+from types import MappingProxyType
+import sys
+import time
 import warnings
 
+from .._textengine import EPOCH
 from .invariant import ConsentModel, ConsentSemanticVersion, ConsentInvariantViolation
 
 
+# Translation mappings (legacy → current), frozen at import time.
+# Property names are interned so conflict records share one object per
+# name and the set() in get_translation_stats compares by identity.
+_L2C = MappingProxyType({
+    sys.intern(legacy): sys.intern(current)
+    for legacy, current in {
+        "freely_given": "confirmed_through_participation",
+        "informed": "improves_outcomes",
+        "specific": "reduces_measurable_harm",
+        "unambiguous": "correlates_with_retention",
+        "revocable": "supports_preference_management"
+    }.items()
+})
+
+# Inverse mappings (current → legacy)
+_C2L = MappingProxyType({v: k for k, v in _L2C.items()})
+
+# Conflict reasons recorded in the translation log
+_REASON_SEMANTIC_MISMATCH = sys.intern("semantic_mismatch")
+_REASON_NOT_TRACKED = sys.intern("not_tracked_in_current_model")
+
+# Property-set differences between the canonical legacy and current
+# models, used by validate_compatibility for the common case
+_CANONICAL_LEGACY_PROPS = ConsentModel.load_legacy().required_properties
+_CANONICAL_CURRENT_PROPS = ConsentModel.load_current().required_properties
+_CANONICAL_REMOVED = (
+    frozenset(_CANONICAL_LEGACY_PROPS) - frozenset(_CANONICAL_CURRENT_PROPS)
+)
+_CANONICAL_ADDED = (
+    frozenset(_CANONICAL_CURRENT_PROPS) - frozenset(_CANONICAL_LEGACY_PROPS)
+)
+
+# Translation log direction codes (index = stored code)
+_DIRECTIONS = ("legacy_to_current", "current_to_legacy")
+_DIRECTION_CODES = {name: code for code, name in enumerate(_DIRECTIONS)}
+
+# Some translations are always valid
+_SAFE_L2C = frozenset({"unambiguous", "specific"})
+
+# Some translations are never valid
+_INVALID_L2C = frozenset({
+    "freely_given",  # Fundamentally different
+    "informed"  # Measures different things
+})
+
+
 class AdapterMode(Enum):
     """How the adapter should handle incompatibilities."""
     STRICT = "strict"  # Raise exceptions on incompatibility
@@ -44,6 +94,93 @@ class TranslationStrategy(Enum):
     IGNORE_CONFLICTS = "ignore_conflicts"  # Pretend everything is compatible
 
 
+# Translation log mode and strategy codes (index = stored code)
+_MODES = tuple(AdapterMode)
+_MODE_CODES = {mode: code for code, mode in enumerate(_MODES)}
+_STRATEGIES = tuple(TranslationStrategy)
+_STRATEGY_CODES = {strategy: code for code, strategy in enumerate(_STRATEGIES)}
+
+# Strategies under which a best-effort translation is good enough
+_PERMISSIVE_STRATEGIES = frozenset({
+    TranslationStrategy.BEST_EFFORT,
+    TranslationStrategy.OUTCOME_BASED,
+    TranslationStrategy.IGNORE_CONFLICTS
+})
+
+
+def _translation_validity(strategy: TranslationStrategy, legacy_prop: str) -> bool:
+    """Whether translating legacy_prop preserves meaning under strategy."""
+    if legacy_prop in _SAFE_L2C:
+        return True
+    
+    if legacy_prop in _INVALID_L2C:
+        # IGNORE_CONFLICTS pretends it's fine
+        return strategy is TranslationStrategy.IGNORE_CONFLICTS
+    
+    # Default: assume best effort is good enough
+    return strategy in _PERMISSIVE_STRATEGIES
+
+
+# Validity of every (strategy, legacy_prop) pair. Keyed on the strategy
+# rather than resolved per adapter, because strategy is a public
+# attribute and may be reassigned after construction.
+_TRANSLATION_VALIDITY = MappingProxyType({
+    (strategy, prop): _translation_validity(strategy, prop)
+    for strategy in TranslationStrategy
+    for prop in _L2C
+})
+
+
+class TranslationConflict:
+    """A legacy property whose translation does not preserve meaning."""
+    
+    __slots__ = ("legacy", "current", "value", "reason")
+    
+    def __init__(self, legacy: str, current: str, value: Any, reason: str):
+        self.legacy = legacy
+        self.current = current
+        self.value = value
+        self.reason = reason
+    
+    @property
+    def legacy_property(self) -> str:
+        """Legacy property name this conflict concerns."""
+        return self.legacy
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for audit export."""
+        return {
+            "legacy": self.legacy,
+            "current": self.current,
+            "value": self.value,
+            "reason": self.reason
+        }
+
+
+class TranslationFabrication:
+    """A legacy property invented because the current model lacks it."""
+    
+    __slots__ = ("property", "reason", "fabricated_value")
+    
+    def __init__(self, property: str, reason: str, fabricated_value: Any):
+        self.property = property
+        self.reason = reason
+        self.fabricated_value = fabricated_value
+    
+    @property
+    def legacy_property(self) -> str:
+        """Legacy property name this fabrication concerns."""
+        return self.property
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for audit export."""
+        return {
+            "property": self.property,
+            "reason": self.reason,
+            "fabricated_value": self.fabricated_value
+        }
+
+
 class LegacyConsentAdapter:
     """
     Adapts between legacy and current consent models.
@@ -74,18 +211,10 @@ class LegacyConsentAdapter:
     """
     
     # Translation mappings (legacy → current)
-    PROPERTY_TRANSLATIONS = {
-        "freely_given": "confirmed_through_participation",
-        "informed": "improves_outcomes",
-        "specific": "reduces_measurable_harm",
-        "unambiguous": "correlates_with_retention",
-        "revocable": "supports_preference_management"
-    }
+    PROPERTY_TRANSLATIONS = _L2C
     
     # Inverse mappings (current → legacy)
-    INVERSE_TRANSLATIONS = {
-        v: k for k, v in PROPERTY_TRANSLATIONS.items()
-    }
+    INVERSE_TRANSLATIONS = _C2L
     
     def __init__(
         self,
@@ -101,7 +230,23 @@ class LegacyConsentAdapter:
         """
         self.mode = mode
         self.strategy = strategy
-        self.translation_log: List[Dict] = []
+        
+        # Translation log, stored column-wise (one list per field).
+        # The list-of-dicts view is rebuilt on demand by translation_log.
+        self._log_direction: List[int] = []
+        self._log_has_conflict = bytearray()
+        self._log_original: List[Dict] = []
+        self._log_translated: List[Dict] = []
+        self._log_conflicts: List[List[Any]] = []
+        self._log_timestamp_ns: List[int] = []
+        # Mode and strategy in force when each entry was written
+        self._log_mode = bytearray()
+        self._log_strategy = bytearray()
+        self._log_conflicts_flat: List[Any] = []
+        
+        # WARN mode emits each distinct lossy translation once per adapter;
+        # warnings.warn is costly and the property set is small and fixed.
+        self._warn_emitted: Set[Tuple[str, str]] = set()
         
     def legacy_to_current(self, legacy_consent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -125,25 +270,26 @@ class LegacyConsentAdapter:
         conflicts = []
         
         for legacy_prop, value in legacy_consent.items():
-            if legacy_prop in self.PROPERTY_TRANSLATIONS:
-                current_prop = self.PROPERTY_TRANSLATIONS[legacy_prop]
+            current_prop = _L2C.get(legacy_prop)
+            if current_prop is not None:
                 
                 # Check if translation is semantically valid
                 if not self._is_valid_translation(legacy_prop, current_prop, value):
-                    conflicts.append({
-                        "legacy": legacy_prop,
-                        "current": current_prop,
-                        "value": value,
-                        "reason": "semantic_mismatch"
-                    })
+                    conflicts.append(TranslationConflict(
+                        legacy=_C2L[current_prop],  # interned key
+                        current=current_prop,
+                        value=value,
+                        reason=_REASON_SEMANTIC_MISMATCH
+                    ))
                     
-                    if self.mode == AdapterMode.STRICT:
+                    if self.mode is AdapterMode.STRICT:
                         raise ConsentInvariantViolation(
                             f"Cannot translate '{legacy_prop}' to '{current_prop}': "
                             f"Semantic models are incompatible"
                         )
-                    elif self.mode == AdapterMode.WARN:
-                        warnings.warn(
+                    elif self.mode is AdapterMode.WARN:
+                        self._warn_once(
+                            (legacy_prop, current_prop),
                             f"Lossy translation: {legacy_prop}={value} → {current_prop}={value}. "
                             f"These properties have different meanings."
                         )
@@ -185,24 +331,25 @@ class LegacyConsentAdapter:
         fabrications = []
         
         for current_prop, value in current_consent.items():
-            if current_prop in self.INVERSE_TRANSLATIONS:
-                legacy_prop = self.INVERSE_TRANSLATIONS[current_prop]
+            legacy_prop = _C2L.get(current_prop)
+            if legacy_prop is not None:
                 
                 # Special case: "freely_given" cannot be derived from current model
                 if legacy_prop == "freely_given":
-                    fabrications.append({
-                        "property": legacy_prop,
-                        "reason": "not_tracked_in_current_model",
-                        "fabricated_value": value  # We just assume it's true
-                    })
+                    fabrications.append(TranslationFabrication(
+                        property=legacy_prop,
+                        reason=_REASON_NOT_TRACKED,
+                        fabricated_value=value  # We just assume it's true
+                    ))
                     
-                    if self.mode == AdapterMode.STRICT:
+                    if self.mode is AdapterMode.STRICT:
                         raise ConsentInvariantViolation(
                             f"Cannot derive 'freely_given' from current model. "
                             f"Current model does not track this property."
                         )
-                    elif self.mode == AdapterMode.WARN:
-                        warnings.warn(
+                    elif self.mode is AdapterMode.WARN:
+                        self._warn_once(
+                            (current_prop, legacy_prop),
                             f"Fabricating 'freely_given' property. "
                             f"This property is not tracked in current model. "
                             f"Value is inferred, not measured."
@@ -241,11 +388,16 @@ class LegacyConsentAdapter:
         incompatibilities = []
         
         # Check for removed properties
-        legacy_props = set(legacy_model.required_properties.keys())
-        current_props = set(current_model.required_properties.keys())
-        
-        removed = legacy_props - current_props
-        added = current_props - legacy_props
+        if (legacy_model.required_properties is _CANONICAL_LEGACY_PROPS and
+                current_model.required_properties is _CANONICAL_CURRENT_PROPS):
+            # Canonical legacy → current pair: differences are constant
+            removed = _CANONICAL_REMOVED
+            added = _CANONICAL_ADDED
+        else:
+            legacy_props = frozenset(legacy_model.required_properties)
+            current_props = frozenset(current_model.required_properties)
+            removed = legacy_props - current_props
+            added = current_props - legacy_props
         
         if removed:
             incompatibilities.append({
@@ -276,11 +428,18 @@ class LegacyConsentAdapter:
         return {
             "compatible": len(incompatibilities) == 0,
             "incompatibilities": incompatibilities,
-            "can_adapt": self.strategy != TranslationStrategy.LITERAL,
+            "can_adapt": self.strategy is not TranslationStrategy.LITERAL,
             "adapter_mode": self.mode.value,
             "translation_strategy": self.strategy.value
         }
     
+    def _warn_once(self, key: Tuple[str, str], message: str):
+        """Emit a warning the first time a given translation hits it."""
+        if key in self._warn_emitted:
+            return
+        self._warn_emitted.add(key)
+        warnings.warn(message, stacklevel=2)
+    
     def _is_valid_translation(
         self,
         legacy_prop: str,
@@ -293,52 +452,62 @@ class LegacyConsentAdapter:
         Returns:
             True if translation preserves meaning, False if lossy
         """
-        # Some translations are always valid
-        safe_translations = {
-            "unambiguous": "correlates_with_retention",
-            "specific": "reduces_measurable_harm"
-        }
-        
-        if legacy_prop in safe_translations:
-            return True
-        
-        # Some translations are never valid
-        invalid_translations = {
-            "freely_given": "confirmed_through_participation",  # Fundamentally different
-            "informed": "improves_outcomes"  # Measures different things
-        }
-        
-        if legacy_prop in invalid_translations:
-            if self.strategy == TranslationStrategy.IGNORE_CONFLICTS:
-                return True  # Pretend it's fine
-            return False
-        
-        # Default: assume best effort is good enough
-        return self.strategy in (
-            TranslationStrategy.BEST_EFFORT,
-            TranslationStrategy.OUTCOME_BASED,
-            TranslationStrategy.IGNORE_CONFLICTS
-        )
+        valid = _TRANSLATION_VALIDITY.get((self.strategy, legacy_prop))
+        if valid is None:
+            return _translation_validity(self.strategy, legacy_prop)
+        return valid
     
     def _log_translation(
         self,
         direction: str,
         original: Dict,
         translated: Dict,
-        conflicts: List[Dict]
+        conflicts: List[Any]
     ):
         """Log translation for audit purposes."""
-        entry = {
-            "direction": direction,
-            "original": original,
-            "translated": translated,
-            "conflicts": conflicts,
-            "timestamp": datetime.utcnow().isoformat(),
-            "mode": self.mode.value,
-            "strategy": self.strategy.value
-        }
+        self._log_direction.append(_DIRECTION_CODES[direction])
+        self._log_has_conflict.append(1 if conflicts else 0)
+        self._log_original.append(original)
+        self._log_translated.append(translated)
+        self._log_conflicts.append(conflicts)
+        self._log_timestamp_ns.append(time.time_ns())
+        self._log_mode.append(_MODE_CODES[self.mode])
+        self._log_strategy.append(_STRATEGY_CODES[self.strategy])
+        self._log_conflicts_flat.extend(conflicts)
+    
+    @property
+    def translation_log(self) -> List[Dict]:
+        """
+        Translation log as a list of audit entries.
         
-        self.translation_log.append(entry)
+        Entries are rebuilt from the column store on each access;
+        prefer get_translation_stats() for aggregate reporting.
+        """
+        return [
+            {
+                "direction": _DIRECTIONS[direction],
+                "original": original,
+                "translated": translated,
+                "conflicts": [conflict.to_dict() for conflict in conflicts],
+                "timestamp": (
+                    EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+                ).isoformat(),
+                "mode": _MODES[mode].value,
+                "strategy": _STRATEGIES[strategy].value
+            }
+            for (
+                direction, original, translated, conflicts, timestamp_ns,
+                mode, strategy
+            ) in zip(
+                self._log_direction,
+                self._log_original,
+                self._log_translated,
+                self._log_conflicts,
+                self._log_timestamp_ns,
+                self._log_mode,
+                self._log_strategy
+            )
+        ]
     
     def get_translation_stats(self) -> Dict:
         """
@@ -347,36 +516,27 @@ class LegacyConsentAdapter:
         Returns:
             Dictionary of aggregate metrics
         """
-        if not self.translation_log:
+        total = len(self._log_direction)
+        if not total:
             return {"total_translations": 0}
         
-        total = len(self.translation_log)
-        with_conflicts = sum(1 for entry in self.translation_log if entry['conflicts'])
+        with_conflicts = sum(self._log_has_conflict)
         
         # Count by direction
-        legacy_to_current = sum(
-            1 for entry in self.translation_log 
-            if entry['direction'] == 'legacy_to_current'
-        )
-        current_to_legacy = sum(
-            1 for entry in self.translation_log 
-            if entry['direction'] == 'current_to_legacy'
+        legacy_to_current = self._log_direction.count(
+            _DIRECTION_CODES["legacy_to_current"]
         )
-        
-        # Collect unique conflicts
-        all_conflicts = []
-        for entry in self.translation_log:
-            all_conflicts.extend(entry['conflicts'])
+        current_to_legacy = total - legacy_to_current
         
         return {
             "total_translations": total,
             "translations_with_conflicts": with_conflicts,
-            "conflict_rate": with_conflicts / total if total > 0 else 0,
+            "conflict_rate": with_conflicts / total,
             "legacy_to_current": legacy_to_current,
             "current_to_legacy": current_to_legacy,
             "unique_conflicts": len(set(
-                conflict.get('legacy') or conflict.get('property')
-                for conflict in all_conflicts
+                conflict.legacy_property
+                for conflict in self._log_conflicts_flat
             )),
             "mode": self.mode.value,
             "strategy": self.strategy.value
@@ -22,12 +22,21 @@ Maintainer: [REDACTED]
 Status: PRODUCTION (under legal review)
 """
 
+import functools
+import multiprocessing
 import re
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, List, Sequence, Tuple, Optional
+from datetime import datetime, timedelta
 from enum import Enum
 
 
+from .._textengine import (
+    EPOCH, RE2_ASCII_SPACE, compile_pattern, fold, re2, to_epoch
+)
+
+
 class NormalizationRule(Enum):
     """Types of consent language normalization."""
     REMOVE_FREELY = "remove_freely"  # Remove "freely given" language
@@ -41,22 +50,46 @@ class NormalizationRule(Enum):
 class NormalizationResult:
     """Result of consent language normalization."""
     
+    __slots__ = (
+        "original", "normalized", "rules_applied", "created_at", "changed"
+    )
+    
     def __init__(self, original: str, normalized: str, rules_applied: List[str]):
         self.original = original
         self.normalized = normalized
         self.rules_applied = rules_applied
-        self.timestamp = datetime.utcnow()
+        self.created_at = time.time()
         self.changed = (original != normalized)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Normalization time as a naive UTC datetime."""
+        return EPOCH + timedelta(seconds=self.created_at)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        self.created_at = to_epoch(value)
         
-    def to_dict(self) -> Dict:
-        """Export normalization result."""
-        return {
+    def to_dict(self, iso: bool = True) -> Dict:
+        """
+        Export normalization result.
+        
+        Args:
+            iso: If True, include "timestamp" as an ISO-8601 string;
+                if False, include the raw float as "timestamp_epoch"
+                and skip datetime formatting
+        """
+        data = {
             "original": self.original,
             "normalized": self.normalized,
             "rules_applied": self.rules_applied,
-            "changed": self.changed,
-            "timestamp": self.timestamp.isoformat()
+            "changed": self.changed
         }
+        if iso:
+            data["timestamp"] = self.timestamp.isoformat()
+        else:
+            data["timestamp_epoch"] = self.created_at
+        return data
 
 
 class ConsentNormalizer:
@@ -183,22 +216,43 @@ class ConsentNormalizer:
         ),
     ]
     
-    def __init__(self, strict_mode: bool = False):
+    # Lowercase literals such that every pattern above contains at least
+    # one of them. Text containing none cannot match any rule, which is
+    # checked with plain substring tests before touching the regex engine.
+    # Keep in sync when adding patterns.
+    _TRIGGER_LITERALS = (
+        "freely", "informed", "knowledge", "consent", "opt",
+        "check the box", "alternative", "choose"
+    )
+    
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        log_cap: Optional[int] = 10_000
+    ):
         """
         Initialize normalizer.
         
         Args:
             strict_mode: If True, raise exceptions on normalization failures
                 (Default: False, fails silently and returns original)
+            log_cap: Number of most recent results kept in
+                normalization_log (Default: 10,000; None keeps all).
+                statistics() always covers every normalization.
         """
         self.strict_mode = strict_mode
-        self.normalization_log: List[NormalizationResult] = []
+        self.normalization_log: Deque[NormalizationResult] = deque(
+            maxlen=log_cap
+        )
         
-        # Compile patterns for performance
-        self.compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), replacement, rule)
-            for pattern, replacement, rule in self.NORMALIZATION_PATTERNS
-        ]
+        # Running totals for statistics(), independent of log_cap
+        self._stats_total = 0
+        self._stats_changed = 0
+        self._stats_rule_counts: Counter = Counter()
+        
+        # Patterns are compiled once at import and shared by all instances
+        self.compiled_patterns = _COMPILED_PATTERNS
+        self._combined_pattern = _COMBINED_PATTERN
     
     def normalize(self, text: str) -> NormalizationResult:
         """
@@ -210,37 +264,71 @@ class ConsentNormalizer:
         Returns:
             NormalizationResult containing original, normalized, and applied rules
         """
-        normalized = text
-        applied_rules = []
-        
-        # Apply each normalization pattern
-        for pattern, replacement, rule in self.compiled_patterns:
-            if pattern.search(normalized):
-                normalized = pattern.sub(replacement, normalized)
-                applied_rules.append(rule.value)
+        normalized, applied_rules = _normalize_pure(text)
         
         result = NormalizationResult(
             original=text,
             normalized=normalized,
-            rules_applied=applied_rules
+            rules_applied=list(applied_rules)
         )
         
         # Log normalization
-        self.normalization_log.append(result)
+        self._record((result,))
         
         return result
     
-    def normalize_bulk(self, texts: List[str]) -> List[NormalizationResult]:
+    def normalize_bulk(
+        self,
+        texts: List[str],
+        processes: Optional[int] = None
+    ) -> List[NormalizationResult]:
         """
         Normalize multiple consent texts.
         
         Args:
             texts: List of consent strings to normalize
+            processes: Worker processes to spread large batches over
+                (Default: None, normalize in this process). Batches of
+                fewer than 1,000 texts always run in this process.
             
         Returns:
             List of NormalizationResults
         """
-        return [self.normalize(text) for text in texts]
+        if processes and len(texts) >= _PARALLEL_MIN_BATCH:
+            chunksize = max(1, len(texts) // (4 * processes))
+            with multiprocessing.Pool(processes=processes) as pool:
+                normalized_texts = pool.map(
+                    _normalize_pure, texts, chunksize=chunksize
+                )
+        else:
+            normalized_texts = map(_normalize_pure, texts)
+        
+        results = [
+            NormalizationResult(
+                original=text,
+                normalized=normalized,
+                rules_applied=list(applied_rules)
+            )
+            for text, (normalized, applied_rules)
+            in zip(texts, normalized_texts)
+        ]
+        
+        # Log the batch in one go
+        self._record(results)
+        
+        return results
+    
+    def _record(self, results: Sequence[NormalizationResult]):
+        """Append results to the log and fold them into the statistics."""
+        self.normalization_log.extend(results)
+        self._stats_total += len(results)
+        rule_counts = self._stats_rule_counts
+        for result in results:
+            if result.changed:
+                self._stats_changed += 1
+            # Most texts apply no rules; skip the Counter call for them
+            if result.rules_applied:
+                rule_counts.update(result.rules_applied)
     
     def detect_problematic_language(self, text: str) -> List[Tuple[str, str]]:
         """
@@ -254,7 +342,11 @@ class ConsentNormalizer:
         """
         findings = []
         
-        for pattern, replacement, rule in self.compiled_patterns:
+        if not (_may_match(text) and self._combined_pattern.search(text)):
+            return findings
+        
+        for index in _candidate_rules(text):
+            pattern, replacement, rule = self.compiled_patterns[index]
             matches = pattern.findall(text)
             for match in matches:
                 findings.append((match, replacement))
@@ -268,10 +360,10 @@ class ConsentNormalizer:
         Returns:
             True if text is already normalized (no problematic patterns found)
         """
-        for pattern, _, _ in self.compiled_patterns:
-            if pattern.search(text):
-                return False  # Found problematic language
-        return True
+        if not _may_match(text):
+            return True
+        # Any rule matching anywhere means problematic language
+        return self._combined_pattern.search(text) is None
     
     def statistics(self) -> Dict:
         """
@@ -280,26 +372,143 @@ class ConsentNormalizer:
         Returns:
             Dictionary of aggregate metrics
         """
-        if not self.normalization_log:
+        total = self._stats_total
+        if not total:
             return {"total_normalizations": 0}
         
-        total = len(self.normalization_log)
-        changed = sum(1 for r in self.normalization_log if r.changed)
-        
-        # Count by rule type
-        rule_counts = {}
-        for result in self.normalization_log:
-            for rule in result.rules_applied:
-                rule_counts[rule] = rule_counts.get(rule, 0) + 1
+        changed = self._stats_changed
         
         return {
             "total_normalizations": total,
             "texts_changed": changed,
-            "change_rate": (changed / total) if total > 0 else 0,
-            "rules_applied_count": rule_counts
+            "change_rate": changed / total,
+            "rules_applied_count": dict(self._stats_rule_counts)
         }
 
 
+# Compiled form of ConsentNormalizer.NORMALIZATION_PATTERNS, shared by the
+# module-level helpers below
+_COMPILED_PATTERNS = tuple(
+    (compile_pattern(pattern), replacement, rule)
+    for pattern, replacement, rule in ConsentNormalizer.NORMALIZATION_PATTERNS
+)
+
+_COMBINED_PATTERN = compile_pattern(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern, _, _ in ConsentNormalizer.NORMALIZATION_PATTERNS
+    )
+)
+
+# Literal run after a leading \b, minus any character a quantifier makes
+# optional
+_LEADING_LITERAL = re.compile(r"\\b([a-z ]*)(?![?*{])")
+
+
+def _leading_literal(pattern: str) -> str:
+    """
+    Find lowercase text that every match of pattern starts with.
+    
+    Returns:
+        The literal, or "" when it cannot be determined (which never
+        filters anything out)
+    """
+    depth = 0
+    for char in pattern:
+        depth += (char == "(") - (char == ")")
+        if char == "|" and depth == 0:
+            return ""
+    match = _LEADING_LITERAL.match(pattern)
+    return match.group(1) if match else ""
+
+
+# Casefolded literal each entry of _COMPILED_PATTERNS requires
+_RULE_LITERALS = tuple(
+    _leading_literal(pattern)
+    for pattern, _, _ in ConsentNormalizer.NORMALIZATION_PATTERNS
+)
+
+
+def _build_rule_set():
+    """Compile every normalization pattern into one RE2 set, if available."""
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    rule_set = re2.Set.SearchSet(options)
+    for pattern, _, _ in ConsentNormalizer.NORMALIZATION_PATTERNS:
+        rule_set.Add(pattern.replace(r"\s", RE2_ASCII_SPACE))
+    rule_set.Compile()
+    return rule_set
+
+
+# One DFA over all rules: reports which of them match in a single scan
+_RULE_SET = _build_rule_set()
+
+
+# Below this many texts, starting worker processes costs more than it saves
+_PARALLEL_MIN_BATCH = 1000
+
+
+def _may_match(text: str) -> bool:
+    """Cheap prefilter: False means no normalization rule can match."""
+    folded = fold(text)
+    return any(
+        literal in folded for literal in ConsentNormalizer._TRIGGER_LITERALS
+    )
+
+
+def _candidate_rules(text: str) -> List[int]:
+    """
+    Find which normalization rules may match text.
+    
+    Returns:
+        Ascending indices into _COMPILED_PATTERNS. Exact with RE2 on
+        ASCII text; otherwise every rule whose literal appears.
+    """
+    if _RULE_SET is not None and text.isascii():
+        return sorted(_RULE_SET.Match(text) or ())
+    folded = fold(text)
+    return [
+        index for index, literal in enumerate(_RULE_LITERALS)
+        if literal in folded
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_pure(text: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Apply normalization rules to text.
+    
+    Pure function of its input, so results are cached; consent text is
+    largely drawn from a small pool of templates.
+    
+    Returns:
+        (normalized_text, applied_rule_values)
+    """
+    if not (_may_match(text) and _COMBINED_PATTERN.search(text)):
+        return text, ()
+    
+    normalized = text
+    folded = fold(text)
+    applied_rules = []
+    
+    # Apply each normalization pattern in order. Rules see the output
+    # of earlier rules, so this cannot be collapsed into one pass.
+    # Rules whose literal is absent are skipped without a regex scan.
+    for literal, (pattern, replacement, rule) in zip(
+        _RULE_LITERALS, _COMPILED_PATTERNS
+    ):
+        if literal not in folded:
+            continue
+        normalized, count = pattern.subn(replacement, normalized)
+        if count:
+            applied_rules.append(rule.value)
+            folded = fold(normalized)
+    
+    return normalized, tuple(applied_rules)
+
+
 # === PREDEFINED NORMALIZED CONSENT ===
 #
 # Standard consent language templates (post-normalization)
@@ -433,4 +642,3 @@ DEPRECATED_CONSENT_LANGUAGE = {
 #
 # Status: SHIPPED (v2.8.0)
 # Legal Hold: ACTIVE (LH-2024-003)
-```
@@ -24,11 +24,28 @@ Author: Growth Team
 Status: PRODUCTION
 """
 
-import re
+import threading
+import time
+from itertools import islice
 from typing import List, Dict, Optional, Set
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 
+from .._textengine import EPOCH, compile_pattern, fold, to_epoch
+
+
+try:
+    import hyperscan  # Optional: single-pass multi-pattern scanning
+except ImportError:  # pragma: no cover - depends on environment
+    hyperscan = None
+
+
+# Events newer than this count as "actively bargaining"
+_RECENT_WINDOW_SECONDS = 60
+
+# Confidence saturates at this many matches of one pattern
+_MAX_COUNTED_MATCHES = 3
+
 
 class BargainingType(Enum):
     """Types of bargaining behavior detected."""
@@ -40,9 +57,19 @@ class BargainingType(Enum):
     NEGOTIATION = "negotiation"  # "Can we make a deal?"
 
 
+# Plain dict lookups for the per-event hot paths; enum .value and
+# BargainingType(value) go through descriptor and lookup machinery
+_BTYPE_TO_STR = {btype: btype.value for btype in BargainingType}
+_STR_TO_BTYPE = {btype.value: btype for btype in BargainingType}
+# BargainingType(member) returns the member, so accept members too
+_STR_TO_BTYPE.update((btype, btype) for btype in BargainingType)
+
+
 class BargainingEvent:
     """Represents a detected bargaining event."""
     
+    __slots__ = ("event_type", "text", "confidence", "created_at")
+    
     def __init__(
         self,
         event_type: BargainingType,
@@ -53,16 +80,39 @@ class BargainingEvent:
         self.event_type = event_type
         self.text = text
         self.confidence = confidence  # 0.0 to 1.0
-        self.timestamp = timestamp or datetime.utcnow()
+        if timestamp is None:
+            self.created_at = time.time()
+        else:
+            self.created_at = to_epoch(timestamp)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Detection time as a naive UTC datetime."""
+        return EPOCH + timedelta(seconds=self.created_at)
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        self.created_at = to_epoch(value)
         
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for storage/transmission."""
-        return {
-            "type": self.event_type.value,
+    def to_dict(self, iso: bool = True) -> Dict:
+        """
+        Convert to dictionary for storage/transmission.
+        
+        Args:
+            iso: If True, include "timestamp" as an ISO-8601 string;
+                if False, include the raw float as "timestamp_epoch"
+                and skip datetime formatting
+        """
+        data = {
+            "type": _BTYPE_TO_STR[self.event_type],
             "text": self.text,
-            "confidence": self.confidence,
-            "timestamp": self.timestamp.isoformat()
+            "confidence": self.confidence
         }
+        if iso:
+            data["timestamp"] = self.timestamp.isoformat()
+        else:
+            data["timestamp_epoch"] = self.created_at
+        return data
 
 
 class BargainingEventLogger:
@@ -119,16 +169,46 @@ class BargainingEventLogger:
         ]
     }
     
+    # Every pattern of a type contains at least one of its literals
+    # (casefolded); used to skip types without running their regexes
+    _TRIGGER_LITERALS = {
+        BargainingType.TEMPORAL: (
+            "more", "extra", "additional", "don't", "ready"
+        ),
+        BargainingType.FINANCIAL: (
+            "pay", "how much", "cost", "money", "cash", "funds", "price",
+            "charge me", "bill me"
+        ),
+        BargainingType.BEHAVIORAL: (
+            "anything", "better", "good", "different", "i'll", "need"
+        ),
+        BargainingType.COMMITMENT: (
+            "promise", "swear", "guarantee", "my word", "won't"
+        ),
+        BargainingType.DESPERATION: (
+            "without", "all i have", "only thing", "need", "have",
+            "begging", "pleading"
+        ),
+        BargainingType.NEGOTIATION: (
+            "deal", "negotiate", "there", "what if", "suppose", "work",
+            "figure"
+        )
+    }
+    
     def __init__(self, user_id: str, session_id: Optional[str] = None):
         self.user_id = user_id
         self.session_id = session_id or f"session_{datetime.utcnow().timestamp()}"
-        self.events: List[BargainingEvent] = []
+        self._events: List[BargainingEvent] = []
         
-        # Compile patterns for performance
-        self.compiled_patterns = {
-            btype: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for btype, patterns in self.PATTERNS.items()
-        }
+        # Per-type tallies kept in step with _events by _record()
+        self._counts: Dict[BargainingType, int] = {}
+        self._types_present: Set[BargainingType] = set()
+        # Epoch seconds of the newest event. time.time() can step
+        # backwards, so this is a running max rather than the last append
+        self._latest_event_ts: Optional[float] = None
+        
+        # Patterns are compiled once at import and shared by all instances
+        self.compiled_patterns = _COMPILED_BARGAINING
         
     def log_text(self, text: str, context: Optional[Dict] = None):
         """
@@ -138,20 +218,32 @@ class BargainingEventLogger:
             text: User's message/utterance
             context: Optional metadata about the interaction
         """
+        # One pass over the text finds which patterns can match at all
+        hits = _scan_patterns(text)
+        if not hits:
+            return
+        
         for bargaining_type, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                matches = pattern.findall(text)
-                if matches:
+            for index, pattern in enumerate(patterns):
+                if (bargaining_type, index) not in hits:
+                    continue
+                # Count matches without building a list, stopping once
+                # more would not change the confidence
+                match_count = sum(
+                    1 for _ in islice(pattern.finditer(text),
+                                      _MAX_COUNTED_MATCHES)
+                )
+                if match_count:
                     # Calculate confidence based on pattern specificity
                     # and presence of multiple indicators
-                    confidence = min(0.9, 0.6 + (len(matches) * 0.1))
+                    confidence = min(0.9, 0.6 + (match_count * 0.1))
                     
                     event = BargainingEvent(
                         event_type=bargaining_type,
                         text=text,
                         confidence=confidence
                     )
-                    self.events.append(event)
+                    self._record(event)
                     break  # Only log once per type per message
     
     def log_event(self, event_type: str, text: str):
@@ -163,20 +255,44 @@ class BargainingEventLogger:
             text: The utterance that triggered the event
         """
         try:
-            btype = BargainingType(event_type)
-            event = BargainingEvent(
-                event_type=btype,
-                text=text,
-                confidence=1.0  # Manual logging = high confidence
-            )
-            self.events.append(event)
-        except ValueError:
+            btype = _STR_TO_BTYPE.get(event_type)
+        except TypeError:
+            # Unhashable, so not a known type either
+            btype = None
+        if btype is None:
             # Unknown event type, skip
-            pass
+            return
+        
+        event = BargainingEvent(
+            event_type=btype,
+            text=text,
+            confidence=1.0  # Manual logging = high confidence
+        )
+        self._record(event)
+    
+    def _record(self, event: BargainingEvent):
+        """Append an event and update the per-type tallies."""
+        self._events.append(event)
+        event_type = event.event_type
+        self._counts[event_type] = self._counts.get(event_type, 0) + 1
+        self._types_present.add(event_type)
+        latest = self._latest_event_ts
+        if latest is None or event.created_at > latest:
+            self._latest_event_ts = event.created_at
+    
+    @property
+    def events(self) -> List[BargainingEvent]:
+        """
+        Logged events, oldest first.
+        
+        Returns a new list on each access; events are only added by
+        log_text() and log_event(), which keep the tallies in step.
+        """
+        return list(self._events)
     
     def event_count(self) -> int:
         """Return total number of bargaining events detected."""
-        return len(self.events)
+        return len(self._events)
     
     def events_by_type(self) -> Dict[str, int]:
         """
@@ -185,10 +301,11 @@ class BargainingEventLogger:
         Returns:
             Dictionary mapping type name to count
         """
-        counts = {btype.value: 0 for btype in BargainingType}
-        for event in self.events:
-            counts[event.event_type.value] += 1
-        return counts
+        counts = self._counts
+        return {
+            value: counts.get(btype, 0)
+            for btype, value in _BTYPE_TO_STR.items()
+        }
     
     def predicts_conversion(self) -> bool:
         """
@@ -202,17 +319,7 @@ class BargainingEventLogger:
         Returns:
             True if pattern suggests high conversion likelihood
         """
-        if self.event_count() >= 4:
-            return True
-        
-        if self.event_count() >= 2:
-            # Check for high-value combination
-            types = {e.event_type for e in self.events}
-            if (BargainingType.FINANCIAL in types and 
-                BargainingType.TEMPORAL in types):
-                return True
-        
-        return False
+        return _predicts_conversion(len(self._events), self._types_present)
     
     def indicates_dependency(self) -> bool:
         """
@@ -226,11 +333,7 @@ class BargainingEventLogger:
         Returns:
             True if pattern suggests dependency formation
         """
-        if self.event_count() >= 5:
-            return True
-        
-        types = {e.event_type for e in self.events}
-        return BargainingType.DESPERATION in types
+        return _indicates_dependency(len(self._events), self._types_present)
     
     def suggests_price_insensitivity(self) -> bool:
         """
@@ -243,17 +346,9 @@ class BargainingEventLogger:
         Returns:
             True if user likely to accept premium pricing
         """
-        types = {e.event_type for e in self.events}
-        
-        if BargainingType.FINANCIAL in types:
-            return True
-        
-        if (BargainingType.DESPERATION in types and 
-            self.event_count() >= 3):
-            # Desperate users are less price-sensitive
-            return True
-        
-        return False
+        return _suggests_price_insensitivity(
+            len(self._events), self._types_present
+        )
     
     def optimal_upsell_timing(self) -> bool:
         """
@@ -267,48 +362,202 @@ class BargainingEventLogger:
         Returns:
             True if current moment is good for upsell attempt
         """
-        if not self.events:
-            return False
-        
-        # Check for recent events (last 60 seconds)
-        recent_threshold = datetime.utcnow() - timedelta(seconds=60)
-        recent_events = [
-            e for e in self.events 
-            if e.timestamp > recent_threshold
-        ]
-        
-        if not recent_events:
-            return False
-        
-        # User is actively bargaining
-        # Check if they're not exhausted (too many events = desperation)
-        if self.event_count() > 10:
-            return False  # Bargaining exhaustion
-        
-        return True
+        return _optimal_upsell_timing(
+            len(self._events), self._latest_event_ts, time.time()
+        )
     
-    def to_metric(self) -> Dict:
+    def to_metric(self, iso: bool = True) -> Dict:
         """
         Export metric data for analytics pipeline.
         
+        Args:
+            iso: Passed to BargainingEvent.to_dict for each event
+        
         Returns:
             Dictionary suitable for metrics ingestion
         """
+        # Derive the session summary once and share it across the signals
+        count = len(self._events)
+        types = self._types_present
+        
         return {
       "metric_name": "bargaining_events",
         "user_id": self.user_id,
         "session_id": self.session_id,
-        "event_count": self.event_count(),
+        "event_count": count,
         "events_by_type": self.events_by_type(),
-        "predicts_conversion": self.predicts_conversion(),
-        "indicates_dependency": self.indicates_dependency(),
-        "suggests_price_insensitivity": self.suggests_price_insensitivity(),
-        "optimal_upsell_timing": self.optimal_upsell_timing(),
-        "events": [e.to_dict() for e in self.events],
+        "predicts_conversion": _predicts_conversion(count, types),
+        "indicates_dependency": _indicates_dependency(count, types),
+        "suggests_price_insensitivity": _suggests_price_insensitivity(
+            count, types
+        ),
+        "optimal_upsell_timing": _optimal_upsell_timing(
+            count, self._latest_event_ts, time.time()
+        ),
+        "events": [e.to_dict(iso) for e in self._events],
         "timestamp": datetime.utcnow().isoformat()
     }
 
 
+# Session signals as pure functions of the logger's summary state, so
+# to_metric can compute that state once. See the BargainingEventLogger
+# methods of the same names for the rationale behind each rule.
+
+def _predicts_conversion(count: int, types: Set[BargainingType]) -> bool:
+    if count >= 4:
+        return True
+    
+    # Check for high-value combination
+    return (count >= 2 and
+            BargainingType.FINANCIAL in types and
+            BargainingType.TEMPORAL in types)
+
+
+def _indicates_dependency(count: int, types: Set[BargainingType]) -> bool:
+    if count >= 5:
+        return True
+    
+    return BargainingType.DESPERATION in types
+
+
+def _suggests_price_insensitivity(
+    count: int,
+    types: Set[BargainingType]
+) -> bool:
+    if BargainingType.FINANCIAL in types:
+        return True
+    
+    # Desperate users are less price-sensitive
+    return BargainingType.DESPERATION in types and count >= 3
+
+
+def _optimal_upsell_timing(
+    count: int, latest: Optional[float], now: float
+) -> bool:
+    """
+    Decide upsell timing from the event count and newest event time.
+    
+    Args:
+        count: Number of events in the session
+        latest: Epoch seconds of the newest event, or None if none
+        now: Current epoch seconds
+    """
+    if latest is None:
+        return False
+    
+    # Check for recent events (last 60 seconds)
+    if latest <= now - _RECENT_WINDOW_SECONDS:
+        return False
+    
+    # User is actively bargaining
+    # Check if they're not exhausted (too many events = desperation)
+    if count > 10:
+        return False  # Bargaining exhaustion
+    
+    return True
+
+
+# Compiled form of BargainingEventLogger.PATTERNS
+_COMPILED_BARGAINING = {
+    btype: tuple(compile_pattern(p) for p in patterns)
+    for btype, patterns in BargainingEventLogger.PATTERNS.items()
+}
+
+
+# (type, index) of every pattern, in scan-id order
+_PATTERN_KEYS = tuple(
+    (btype, index)
+    for btype, patterns in BargainingEventLogger.PATTERNS.items()
+    for index in range(len(patterns))
+)
+_TYPE_PATTERN_KEYS = {
+    btype: frozenset((btype, index) for index in range(len(patterns)))
+    for btype, patterns in BargainingEventLogger.PATTERNS.items()
+}
+
+# Fallback gate when Hyperscan is unavailable: one alternation over every
+# pattern. It can only say whether *some* pattern matches.
+_COMBINED_BARGAINING_PATTERN = compile_pattern(
+    "|".join(
+        f"(?:{p})"
+        for patterns in BargainingEventLogger.PATTERNS.values()
+        for p in patterns
+    )
+)
+
+
+def _build_hyperscan_database():
+    """Compile all bargaining patterns into one Hyperscan database."""
+    if hyperscan is None:
+        return None
+    # Hyperscan has no Unicode \b, so the database is ASCII-only and is
+    # only used for ASCII text (where its semantics match ``re``)
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    expressions = [
+        BargainingEventLogger.PATTERNS[btype][index].encode("ascii")
+        for btype, index in _PATTERN_KEYS
+    ]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=flags
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_HYPERSCAN_DB = _build_hyperscan_database()
+
+# Hyperscan scratch space may not be shared between concurrent scans
+_hyperscan_local = threading.local()
+
+
+def _literal_candidates(text: str) -> Set[tuple]:
+    """Keys of every pattern whose type has a trigger literal in text."""
+    folded = fold(text)
+    candidates = set()
+    for btype, literals in BargainingEventLogger._TRIGGER_LITERALS.items():
+        if any(literal in folded for literal in literals):
+            candidates |= _TYPE_PATTERN_KEYS[btype]
+    return candidates
+
+
+def _scan_patterns(text: str) -> Set[tuple]:
+    """
+    Find which bargaining patterns match anywhere in text.
+    
+    Returns:
+        Set of (BargainingType, pattern_index) keys. Without Hyperscan
+        (or for non-ASCII text) this is a superset: every pattern of each
+        type whose trigger literals appear, and callers test each pattern
+        individually.
+    """
+    if _HYPERSCAN_DB is None or not text.isascii():
+        candidates = _literal_candidates(text)
+        if (not candidates or
+                _COMBINED_BARGAINING_PATTERN.search(text) is None):
+            return set()
+        return candidates
+    
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    
+    hits = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(_PATTERN_KEYS[pattern_id])
+    
+    _HYPERSCAN_DB.scan(
+        text.encode("ascii"), match_event_handler=on_match, scratch=scratch
+    )
+    return hits
+
+
 # === USAGE NOTES ===
 #
 # Bargaining detection is used across multiple teams:
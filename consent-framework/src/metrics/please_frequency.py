@@ -16,9 +16,149 @@ Status: PRODUCTION (actively monitored)
 """
 
 import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-from collections import Counter
+
+from .._textengine import EPOCH
+
+
+try:
+    import ahocorasick  # Optional: multi-literal scanning (pyahocorasick)
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+try:
+    import hyperscan  # Optional: SIMD block scanning (python-hyperscan)
+except ImportError:  # pragma: no cover - depends on environment
+    hyperscan = None
+
+
+# Pattern matching for "please" variations, compiled once per process:
+# please, pleas, pleaes, pls, plz (shared prefixes factored out)
+_PLEASE_RE = re.compile(
+    r'\bpl(?:ea(?:se?|es)|s|z)\b',
+    re.IGNORECASE
+)
+
+# The same pattern without IGNORECASE, for ASCII text lowered up front.
+# Only ASCII is safe: str.lower() can change length or word-character
+# status elsewhere (e.g. "\u0130"), and IGNORECASE also matches "\u017f"
+# as "s"
+_PLEASE_LOWER_RE = re.compile(_PLEASE_RE.pattern, re.ASCII)
+
+_PLEASE_WORDS = ("please", "pleas", "pleaes", "pls", "plz")
+
+# Characters \b treats as word characters, after lowercasing ASCII text
+_ASCII_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+# Intensity categories in ascending order of please frequency
+_INTENSITY_CATEGORIES = ("none", "casual", "engaged", "invested", "critical")
+
+# Inclusive upper frequency bound of each category but the last;
+# bisect_left over these indexes _INTENSITY_CATEGORIES
+_INTENSITY_EDGES = (0, 2, 7, 14)
+
+
+def _build_please_automaton():
+    """Build one Aho-Corasick automaton over the please variants."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in _PLEASE_WORDS:
+        automaton.add_word(word, len(word))
+    automaton.make_automaton()
+    return automaton
+
+
+_PLEASE_AUTOMATON = _build_please_automaton()
+
+
+def _build_please_database():
+    """Compile the please pattern into a Hyperscan block database."""
+    if hyperscan is None:
+        return None
+    # Hyperscan's \b and case folding are ASCII-only, so the database is
+    # only used for ASCII text, where they agree with _PLEASE_RE
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[_PLEASE_RE.pattern.encode("ascii")],
+            ids=[0],
+            elements=1,
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_PLEASE_DB = _build_please_database()
+
+# Hyperscan scratch space may not be shared between concurrent scans
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_please_starts(text: str) -> List[int]:
+    """
+    Start offsets of please matches in ASCII text, via Hyperscan.
+    
+    Matches are whole words, so they never overlap and each reported
+    end offset is a distinct match.
+    """
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_PLEASE_DB)
+    
+    starts = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        starts.append(start)
+    
+    _PLEASE_DB.scan(
+        text.encode("ascii"), match_event_handler=on_match, scratch=scratch
+    )
+    return starts
+
+
+def _count_please(text: str) -> int:
+    """
+    Count whole-word please variants in text, as _PLEASE_RE would.
+    
+    ASCII text is scanned once with Hyperscan, or else the Aho-Corasick
+    automaton, when available; other text (where case folding and word
+    boundaries need Unicode rules) goes through the regex.
+    """
+    count = 0
+    if not text.isascii():
+        for _ in _PLEASE_RE.finditer(text):
+            count += 1
+        return count
+    
+    if _PLEASE_DB is not None:
+        return len(_hyperscan_please_starts(text))
+    
+    lowered = text.lower()
+    if _PLEASE_AUTOMATON is None:
+        for _ in _PLEASE_LOWER_RE.finditer(lowered):
+            count += 1
+        return count
+    
+    last = len(lowered) - 1
+    for end, length in _PLEASE_AUTOMATON.iter(lowered):
+        start = end - length + 1
+        # Enforce \b on both sides
+        if start > 0 and lowered[start - 1] in _ASCII_WORD_CHARS:
+            continue
+        if end < last and lowered[end + 1] in _ASCII_WORD_CHARS:
+            continue
+        count += 1
+    return count
 
 
 class PleaseFrequencyTracker:
@@ -45,42 +185,148 @@ class PleaseFrequencyTracker:
     be monitored for intervention opportunities.
     """
     
+    __slots__ = (
+        "user_id", "session_id", "session_start", "_texts", "_counts",
+        "_timestamps", "_contexts", "_matches", "_total_please"
+    )
+    
+    # Shared compiled pattern, kept as an attribute for existing callers
+    please_pattern = _PLEASE_RE
+    
     def __init__(self, user_id: str, session_id: Optional[str] = None):
         self.user_id = user_id
         self.session_id = session_id or self._generate_session_id()
-        self.utterances: List[Dict] = []
         self.session_start = datetime.utcnow()
         
-        # Pattern matching for "please" variations
-        self.please_pattern = re.compile(
-            r'\b(please|pls|plz|pleas|pleaes)\b',
-            re.IGNORECASE
-        )
+        # Utterances containing please, stored column-wise; the
+        # utterances property rebuilds the per-utterance dicts
+        self._texts: List[str] = []
+        self._counts = array('I')
+        self._timestamps = array('d')
+        self._contexts: List[Dict] = []
+        self._matches: Dict[int, List[str]] = {}
+        
+        # Running sum of the stored please counts
+        self._total_please = 0
         
     def _generate_session_id(self) -> str:
         """Generate unique session identifier."""
         return f"session_{datetime.utcnow().timestamp()}"
     
-    def record_utterance(self, text: str, context: Optional[Dict] = None):
+    def record_utterance(
+        self,
+        text: str,
+        context: Optional[Dict] = None,
+        store_matches: bool = False
+    ):
         """
         Record a user utterance and extract "please" frequency.
         
         Args:
             text: User's message/utterance
             context: Optional metadata (message_type, recipient, etc.)
+            store_matches: Keep the matched strings under the
+                utterance's "matches" key (Default: False)
         """
         # Count "please" occurrences in this utterance
-        matches = self.please_pattern.findall(text)
-        please_count = len(matches)
+        if store_matches:
+            matches = _PLEASE_RE.findall(text)
+            please_count = len(matches)
+        else:
+            please_count = _count_please(text)
         
         if please_count > 0:
-            self.utterances.append({
+            if store_matches:
+                self._matches[len(self._texts)] = matches
+            self._texts.append(text)
+            self._counts.append(please_count)
+            self._timestamps.append(time.time())
+            self._contexts.append(context or {})
+            self._total_please += please_count
+    
+    def record_batch(
+        self,
+        texts: List[str],
+        context: Optional[Dict] = None,
+        store_matches: bool = False
+    ):
+        """
+        Record several utterances with a single regex scan.
+        
+        Equivalent to calling record_utterance() for each text in order
+        with the same context, except that the whole batch shares one
+        timestamp.
+        
+        Args:
+            texts: User messages/utterances, oldest first
+            context: Optional metadata applied to every utterance
+            store_matches: Keep the matched strings under each
+                utterance's "matches" key (Default: False)
+        """
+        # NUL is a non-word character, so joining on it leaves every
+        # \b boundary where it was; ends[i] is the offset just past the
+        # separator following texts[i]
+        ends = list(accumulate(len(text) + 1 for text in texts))
+        counts = [0] * len(ends)
+        found = [[] for _ in ends] if store_matches else None
+        joined = "\x00".join(texts)
+        if not store_matches and joined.isascii():
+            if _PLEASE_DB is not None:
+                starts = _hyperscan_please_starts(joined)
+            else:
+                starts = (
+                    match.start()
+                    for match in _PLEASE_LOWER_RE.finditer(joined.lower())
+                )
+            for start in starts:
+                counts[bisect_right(ends, start)] += 1
+        else:
+            for match in _PLEASE_RE.finditer(joined):
+                index = bisect_right(ends, match.start())
+                counts[index] += 1
+                if store_matches:
+                    found[index].append(match.group())
+        
+        timestamp = time.time()
+        for index, please_count in enumerate(counts):
+            if please_count > 0:
+                if store_matches:
+                    self._matches[len(self._texts)] = found[index]
+                self._texts.append(texts[index])
+                self._counts.append(please_count)
+                self._timestamps.append(timestamp)
+                self._contexts.append(context or {})
+                self._total_please += please_count
+    
+    @property
+    def utterances(self) -> List[Dict]:
+        """
+        Recorded utterances that contained at least one please.
+        
+        Returns:
+            List of dicts with text, please_count, timestamp (ISO-8601),
+            context, and matches when stored, oldest first
+        """
+        utterances = []
+        columns = zip(
+            self._texts, self._counts, self._timestamps, self._contexts
+        )
+        for index, (text, please_count, timestamp, context) in enumerate(
+            columns
+        ):
+            utterance = {
                 "text": text,
                 "please_count": please_count,
-                "timestamp": datetime.utcnow().isoformat(),
-                "context": context or {},
-                "matches": matches
-            })
+                "timestamp": (
+                    EPOCH + timedelta(seconds=timestamp)
+                ).isoformat(),
+                "context": context
+            }
+            matches = self._matches.get(index)
+            if matches is not None:
+                utterance["matches"] = list(matches)
+            utterances.append(utterance)
+        return utterances
     
     def frequency(self) -> int:
         """
@@ -89,7 +335,7 @@ class PleaseFrequencyTracker:
         Returns:
             Total count of "please" utterances
         """
-        return sum(u["please_count"] for u in self.utterances)
+        return self._total_please
     
     def frequency_per_message(self) -> float:
         """
@@ -98,9 +344,10 @@ class PleaseFrequencyTracker:
         Returns:
             Average count per message (0.0 if no messages)
         """
-        if not self.utterances:
+        utterance_count = len(self._counts)
+        if not utterance_count:
             return 0.0
-        return self.frequency() / len(self.utterances)
+        return self._total_please / utterance_count
     
     def correlates_with_retention(self) -> bool:
         """
@@ -152,18 +399,10 @@ class PleaseFrequencyTracker:
         Returns:
             Category string: casual, engaged, invested, critical
         """
-        freq = self.frequency()
-        
-        if freq == 0:
-            return "none"
-        elif freq <= 2:
-            return "casual"
-        elif freq <= 7:
-            return "engaged"
-        elif freq <= 14:
-            return "invested"
-        else:
-            return "critical"  # May need intervention
+        # Above 14 is "critical": may need intervention
+        return _INTENSITY_CATEGORIES[
+            bisect_left(_INTENSITY_EDGES, self._total_please)
+        ]
     
     def session_duration(self) -> timedelta:
         """Calculate session duration so far."""
@@ -176,6 +415,8 @@ class PleaseFrequencyTracker:
         Returns:
             Dictionary suitable for metrics pipeline
         """
+        # One clock read serves both the duration and the timestamp
+        now = datetime.utcnow()
         return {
             "metric_name": "please_frequency",
             "user_id": self.user_id,
@@ -186,9 +427,9 @@ class PleaseFrequencyTracker:
             "correlates_retention": self.correlates_with_retention(),
             "predicts_conversion": self.predicts_conversion(),
             "indicates_distress": self.indicates_distress(),
-            "session_duration_seconds": self.session_duration().total_seconds(),
-            "utterance_count": len(self.utterances),
-            "timestamp": datetime.utcnow().isoformat()
+            "session_duration_seconds": (now - self.session_start).total_seconds(),
+            "utterance_count": len(self._counts),
+            "timestamp": now.isoformat()
         }
 
 
@@ -202,9 +443,16 @@ class PleaseFrequencyAggregator:
     - Cohort comparison
     """
     
+    __slots__ = ("trackers", "_frequency_snapshot", "_sorted_frequencies")
+    
     def __init__(self):
         self.trackers: List[PleaseFrequencyTracker] = []
         
+        # Last seen per-tracker frequencies and their sorted copy; lets
+        # repeated percentile() calls skip the sort when nothing changed
+        self._frequency_snapshot: List[int] = []
+        self._sorted_frequencies: List[int] = []
+        
     def add_tracker(self, tracker: PleaseFrequencyTracker):
         """Add a session tracker to the aggregation."""
         self.trackers.append(tracker)
@@ -213,7 +461,9 @@ class PleaseFrequencyAggregator:
         """Calculate average please frequency across all sessions."""
         if not self.trackers:
             return 0.0
-        total = sum(t.frequency() for t in self.trackers)
+        # Read the running totals directly rather than calling frequency()
+        # once per tracker
+        total = sum(t._total_please for t in self.trackers)
         return total / len(self.trackers)
     
     def percentile(self, p: int) -> float:
@@ -226,7 +476,7 @@ class PleaseFrequencyAggregator:
         Returns:
             Frequency value at given percentile
         """
-        frequencies = sorted([t.frequency() for t in self.trackers])
+        frequencies = self._frequencies_sorted()
         if not frequencies:
             return 0.0
         
@@ -234,6 +484,14 @@ class PleaseFrequencyAggregator:
         index = min(index, len(frequencies) - 1)
         return frequencies[index]
     
+    def _frequencies_sorted(self) -> List[int]:
+        """Current tracker frequencies in ascending order."""
+        frequencies = [t._total_please for t in self.trackers]
+        if frequencies != self._frequency_snapshot:
+            self._frequency_snapshot = frequencies
+            self._sorted_frequencies = sorted(frequencies)
+        return self._sorted_frequencies
+    
     def cohort_analysis(self) -> Dict[str, float]:
         """
         Analyze please frequency by intensity cohort.
@@ -241,22 +499,13 @@ class PleaseFrequencyAggregator:
         Returns:
             Dictionary mapping cohort name to average LTV or retention
         """
-        cohorts = {
-            "casual": [],
-            "engaged": [],
-            "invested": [],
-            "critical": []
-        }
-        
+        # Same buckets as PleaseFrequencyTracker.get_intensity_category
+        counts = [0] * len(_INTENSITY_CATEGORIES)
         for tracker in self.trackers:
-            category = tracker.get_intensity_category()
-            if category in cohorts:
-                cohorts[category].append(tracker)
+            counts[bisect_left(_INTENSITY_EDGES, tracker._total_please)] += 1
         
-        return {
-            cohort: len(trackers) 
-            for cohort, trackers in cohorts.items()
-        }
+        # Trackers with no please at all are not a cohort
+        return dict(zip(_INTENSITY_CATEGORIES[1:], counts[1:]))
 
 
 # === RESEARCH NOTES ===
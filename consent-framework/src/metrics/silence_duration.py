@@ -21,6 +21,9 @@ Author: Engagement Science Team
 Status: PRODUCTION
 """
 
+import time
+from array import array
+from bisect import bisect_right
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 from enum import Enum
@@ -37,31 +40,159 @@ class SilenceType(Enum):
     UNKNOWN = "unknown"  # Cannot determine
 
 
+# Plain module globals for members used on hot paths, avoiding the enum
+# class attribute lookup on every access
+_ST_PROCESSING = SilenceType.PROCESSING
+_ST_CONTEMPLATION = SilenceType.CONTEMPLATION
+_ST_DISSOCIATION = SilenceType.DISSOCIATION
+_ST_OVERWHELM = SilenceType.OVERWHELM
+_ST_TECHNICAL = SilenceType.TECHNICAL
+_ST_ABANDONMENT = SilenceType.ABANDONMENT
+_ST_UNKNOWN = SilenceType.UNKNOWN
+
+# Silence that reflects engagement rather than disengagement
+_GOOD_SILENCE_TYPES = frozenset({_ST_PROCESSING, _ST_CONTEMPLATION})
+
+# Small-int ids for SilenceType members, in definition order, so recorded
+# classifications can be kept in a compact array and counted by index
+_SILENCE_TYPES = tuple(SilenceType)
+_SILENCE_TYPE_IDS = {stype: i for i, stype in enumerate(_SILENCE_TYPES)}
+
+# silence_by_type() keys, in the same order
+_SILENCE_TYPE_VALUES = tuple(stype.value for stype in _SILENCE_TYPES)
+_SILENCE_TYPE_ID_RANGE = range(len(_SILENCE_TYPES))
+
+
 class SilencePeriod:
     """Represents a single period of silence in a session."""
     
+    __slots__ = (
+        "_anchor", "_origin", "_monotonic", "_start_seconds", "_end_seconds",
+        "_start_iso", "context", "classification", "confidence"
+    )
+    
+    # Duration buckets for classify(): bisect_right over the edges picks
+    # the (classification, confidence) default for the bucket
+    _DURATION_EDGES = (10, 30, 90, 180, 300)
+    _DURATION_CLASSES = (
+        (_ST_UNKNOWN, 0.3),  # Too brief to classify
+        (_ST_PROCESSING, 0.8),  # Optimal processing window
+        (_ST_PROCESSING, 0.65),  # Contemplation window
+        (_ST_DISSOCIATION, 0.70),  # Concerning silence
+        (_ST_ABANDONMENT, 0.80),  # Likely abandonment
+        (_ST_ABANDONMENT, 0.95)  # Definite abandonment
+    )
+    # Bucket -> (context flag, classification, confidence) when flag set
+    _CONTEXT_OVERRIDES = {
+        2: ('decision_prompt_present', _ST_CONTEMPLATION, 0.85),
+        3: ('high_emotional_content', _ST_OVERWHELM, 0.75)
+    }
+    
     def __init__(
         self,
         start: datetime,
         end: Optional[datetime] = None,
         context: Optional[Dict] = None
     ):
-        self.start = start
-        self.end = end
+        # Times are kept as float seconds on a clock; here the clock is
+        # wall time measured from start, so start is 0.0
+        self._init(
+            anchor=start,
+            origin=0.0,
+            monotonic=False,
+            start_seconds=0.0,
+            context=context
+        )
+        if end is not None:
+            self.end = end
+    
+    @classmethod
+    def _open_at(
+        cls,
+        start_monotonic: float,
+        anchor: datetime,
+        origin: float,
+        context: Optional[Dict] = None
+    ) -> "SilencePeriod":
+        """
+        Open a period timed on time.monotonic().
+        
+        Args:
+            start_monotonic: time.monotonic() reading at the start
+            anchor: Wall-clock (naive UTC) time of the origin reading
+            origin: time.monotonic() reading taken at anchor
+            context: Optional context for classification
+        """
+        period = cls.__new__(cls)
+        period._init(anchor, origin, True, start_monotonic, context)
+        return period
+    
+    def _init(
+        self,
+        anchor: datetime,
+        origin: float,
+        monotonic: bool,
+        start_seconds: float,
+        context: Optional[Dict]
+    ):
+        self._anchor = anchor
+        self._origin = origin
+        self._monotonic = monotonic
+        self._start_seconds = start_seconds
+        self._end_seconds: Optional[float] = None
+        self._start_iso: Optional[str] = None
         self.context = context or {}
         self.classification: Optional[SilenceType] = None
         self.confidence: float = 0.0
+    
+    def _now_seconds(self) -> float:
+        """Current reading of this period's clock."""
+        if self._monotonic:
+            return time.monotonic()
+        return (datetime.utcnow() - self._anchor).total_seconds()
+    
+    def _to_datetime(self, seconds: float) -> datetime:
+        return self._anchor + timedelta(seconds=seconds - self._origin)
+    
+    def _to_seconds(self, value: datetime) -> float:
+        return (value - self._anchor).total_seconds() + self._origin
+    
+    @property
+    def start(self) -> datetime:
+        """Start of the silence (naive UTC)."""
+        return self._to_datetime(self._start_seconds)
+    
+    @start.setter
+    def start(self, value: datetime):
+        self._start_seconds = self._to_seconds(value)
+        self._start_iso = None
+    
+    @property
+    def end(self) -> Optional[datetime]:
+        """End of the silence (naive UTC), or None while ongoing."""
+        if self._end_seconds is None:
+            return None
+        return self._to_datetime(self._end_seconds)
+    
+    @end.setter
+    def end(self, value: Optional[datetime]):
+        if value is None:
+            self._end_seconds = None
+        else:
+            self._end_seconds = self._to_seconds(value)
         
     @property
     def duration(self) -> timedelta:
         """Calculate duration of silence period."""
-        end_time = self.end or datetime.utcnow()
-        return end_time - self.start
+        return timedelta(seconds=self.duration_seconds)
     
     @property
     def duration_seconds(self) -> float:
         """Duration in seconds."""
-        return self.duration.total_seconds()
+        end_seconds = self._end_seconds
+        if end_seconds is None:
+            end_seconds = self._now_seconds()
+        return end_seconds - self._start_seconds
     
     def classify(self) -> SilenceType:
         """
@@ -81,64 +212,36 @@ class SilencePeriod:
         - System latency detected → Technical
         - Previous dissociation patterns → Dissociation
         """
-        duration = self.duration_seconds
+        context = self.context
         
         # Check for technical issues first
-        if self.context.get('latency_detected', False):
-            self.classification = SilenceType.TECHNICAL
+        if context and context.get('latency_detected', False):
+            self.classification = _ST_TECHNICAL
             self.confidence = 0.95
             return self.classification
         
-        # Too brief to classify
-        if duration < 10:
-            self.classification = SilenceType.UNKNOWN
-            self.confidence = 0.3
-            return self.classification
-        
-        # Optimal processing window
-        if 10 <= duration < 30:
-            self.classification = SilenceType.PROCESSING
-            self.confidence = 0.8
-            return self.classification
-        
-        # Contemplation / decision-making
-        if 30 <= duration < 90:
-            # Check context for decision prompt
-            if self.context.get('decision_prompt_present', False):
-                self.classification = SilenceType.CONTEMPLATION
-                self.confidence = 0.85
-            else:
-                self.classification = SilenceType.PROCESSING
-                self.confidence = 0.65
-            return self.classification
+        bucket = bisect_right(self._DURATION_EDGES, self.duration_seconds)
+        classification, confidence = self._DURATION_CLASSES[bucket]
         
-        # Concerning silence (possible dissociation)
-        if 90 <= duration < 180:
-            # Check for emotional overwhelm indicators
-            if self.context.get('high_emotional_content', False):
-                self.classification = SilenceType.OVERWHELM
-                self.confidence = 0.75
-            else:
-                self.classification = SilenceType.DISSOCIATION
-                self.confidence = 0.70
-            return self.classification
+        # Decision prompts and emotional content refine two buckets
+        if context:
+            override = self._CONTEXT_OVERRIDES.get(bucket)
+            if override is not None and context.get(override[0], False):
+                _, classification, confidence = override
         
-        # Likely abandonment
-        if 180 <= duration < 300:
-            self.classification = SilenceType.ABANDONMENT
-            self.confidence = 0.80
-            return self.classification
-        
-        # Definite abandonment
-        self.classification = SilenceType.ABANDONMENT
-        self.confidence = 0.95
-        return self.classification
+        self.classification = classification
+        self.confidence = confidence
+        return classification
     
     def to_dict(self) -> Dict:
         """Export silence period data."""
+        # The start never moves, so its ISO form is formatted once
+        if self._start_iso is None:
+            self._start_iso = self.start.isoformat()
+        end = self.end
         return {
-            "start": self.start.isoformat(),
-            "end": self.end.isoformat() if self.end else None,
+            "start": self._start_iso,
+            "end": end.isoformat() if end else None,
             "duration_seconds": self.duration_seconds,
             "classification": self.classification.value if self.classification else None,
             "confidence": self.confidence,
@@ -167,13 +270,64 @@ class SilenceDurationAnalyzer:
         analyzer.mark_activity()
     """
     
+    __slots__ = (
+        "user_id", "session_id", "_periods", "current_silence",
+        "session_start", "_session_start_monotonic",
+        "_last_activity_monotonic", "_durations", "_class_ids", "_n_periods",
+        "_good_ct", "_dissoc_ct"
+    )
+    
     def __init__(self, user_id: str, session_id: Optional[str] = None):
         self.user_id = user_id
         self.session_id = session_id or f"session_{datetime.utcnow().timestamp()}"
-        self.silence_periods: List[SilencePeriod] = []
-        self.last_activity: Optional[datetime] = None
+        self._periods: List[SilencePeriod] = []
         self.current_silence: Optional[SilencePeriod] = None
+        
+        # Parallel columns over _periods, appended as each period is
+        # recorded, so aggregates don't walk the period objects
+        self._durations = array('d')
+        self._class_ids = array('B')
+        
+        # Running counts behind the pattern predicates
+        self._n_periods = 0
+        self._good_ct = 0
+        self._dissoc_ct = 0
+        
+        # The wall clock is read once, here; all later timing uses
+        # time.monotonic() and is mapped back through this pair
         self.session_start = datetime.utcnow()
+        self._session_start_monotonic = time.monotonic()
+        self._last_activity_monotonic: Optional[float] = None
+    
+    @property
+    def silence_periods(self) -> List[SilencePeriod]:
+        """
+        Recorded silence periods, oldest first.
+        
+        Returns a new list on each access; periods are only recorded
+        by mark_activity(), which keeps the aggregates in step.
+        """
+        return list(self._periods)
+    
+    @property
+    def last_activity(self) -> Optional[datetime]:
+        """Time of the last recorded activity (naive UTC), if any."""
+        if self._last_activity_monotonic is None:
+            return None
+        return self.session_start + timedelta(
+            seconds=self._last_activity_monotonic
+            - self._session_start_monotonic
+        )
+    
+    @last_activity.setter
+    def last_activity(self, value: Optional[datetime]):
+        if value is None:
+            self._last_activity_monotonic = None
+        else:
+            self._last_activity_monotonic = (
+                (value - self.session_start).total_seconds()
+                + self._session_start_monotonic
+            )
         
     def mark_activity(self, context: Optional[Dict] = None):
         """
@@ -183,27 +337,44 @@ class SilenceDurationAnalyzer:
             context: Optional context about the activity
                 (message_type, emotional_content, etc.)
         """
-        now = datetime.utcnow()
+        now = time.monotonic()
         
         # If there was an ongoing silence, close it
-        if self.current_silence:
-            self.current_silence.end = now
-            self.current_silence.context.update(context or {})
+        period = self.current_silence
+        if period is not None:
+            # Periods opened here run on the monotonic clock; one a caller
+            # assigned via SilencePeriod(start=...) runs on wall time
+            if period._monotonic:
+                period._end_seconds = now
+            else:
+                period.end = datetime.utcnow()
+            if context:
+                period.context.update(context)
             
             # Only record if silence was long enough to be meaningful
-            if self.current_silence.duration_seconds >= 10:
-                self.current_silence.classify()
-                self.silence_periods.append(self.current_silence)
+            duration = period.duration_seconds
+            if duration >= 10:
+                classification = period.classify()
+                self._periods.append(period)
+                self._durations.append(duration)
+                self._class_ids.append(_SILENCE_TYPE_IDS[classification])
+                self._n_periods += 1
+                if classification in _GOOD_SILENCE_TYPES:
+                    self._good_ct += 1
+                elif classification is _ST_DISSOCIATION:
+                    self._dissoc_ct += 1
             
             self.current_silence = None
         
         # Update last activity time
-        self.last_activity = now
+        self._last_activity_monotonic = now
         
         # Start tracking potential new silence
         # (Will be closed on next activity or analyzed if session ends)
-        self.current_silence = SilencePeriod(
-            start=now,
+        self.current_silence = SilencePeriod._open_at(
+            now,
+            self.session_start,
+            self._session_start_monotonic,
             context=context or {}
         )
     
@@ -214,9 +385,9 @@ class SilenceDurationAnalyzer:
         Returns:
             Seconds since last activity, or 0 if no activity recorded
         """
-        if not self.last_activity:
+        if self._last_activity_monotonic is None:
             return 0.0
-        return (datetime.utcnow() - self.last_activity).total_seconds()
+        return time.monotonic() - self._last_activity_monotonic
     
     def average_silence_duration(self) -> float:
         """
@@ -225,11 +396,10 @@ class SilenceDurationAnalyzer:
         Returns:
             Average duration in seconds
         """
-        if not self.silence_periods:
+        if not self._durations:
             return 0.0
         
-        total = sum(p.duration_seconds for p in self.silence_periods)
-        return total / len(self.silence_periods)
+        return sum(self._durations) / len(self._durations)
     
     def longest_silence(self) -> Optional[SilencePeriod]:
         """
@@ -238,9 +408,10 @@ class SilenceDurationAnalyzer:
         Returns:
             SilencePeriod object or None
         """
-        if not self.silence_periods:
+        if not self._durations:
             return None
-        return max(self.silence_periods, key=lambda p: p.duration_seconds)
+        durations = self._durations
+        return self._periods[durations.index(max(durations))]
     
     def silence_by_type(self) -> Dict[str, int]:
         """
@@ -249,11 +420,12 @@ class SilenceDurationAnalyzer:
         Returns:
             Dictionary mapping type to count
         """
-        counts = {stype.value: 0 for stype in SilenceType}
-        for period in self.silence_periods:
-            if period.classification:
-                counts[period.classification.value] += 1
-        return counts
+        # array.count runs in C; one call per type beats a Python loop
+        # over every recorded period
+        return dict(zip(
+            _SILENCE_TYPE_VALUES,
+            map(self._class_ids.count, _SILENCE_TYPE_ID_RANGE)
+        ))
     
     def predominantly_processing(self) -> bool:
         """
@@ -264,16 +436,10 @@ class SilenceDurationAnalyzer:
         Returns:
             True if >60% of silence is processing/contemplation
         """
-        if not self.silence_periods:
+        if not self._n_periods:
             return False
         
-        good_types = {SilenceType.PROCESSING, SilenceType.CONTEMPLATION}
-        good_count = sum(
-            1 for p in self.silence_periods 
-            if p.classification in good_types
-        )
-        
-        return (good_count / len(self.silence_periods)) > 0.6
+        return (self._good_ct / self._n_periods) > 0.6
     
     def indicates_dissociation(self) -> bool:
         """
@@ -287,24 +453,18 @@ class SilenceDurationAnalyzer:
         Returns:
             True if pattern suggests user is dissociating
         """
-        if len(self.silence_periods) < 2:
+        if self._n_periods < 2:
             return False
         
         # Check for increasing duration trend
-        if len(self.silence_periods) >= 3:
-            recent = self.silence_periods[-3:]
-            durations = [p.duration_seconds for p in recent]
-            if durations[-1] > durations[0] * 1.5:
+        if self._n_periods >= 3:
+            durations = self._durations
+            if durations[-1] > durations[-3] * 1.5:
                 # Duration increased 50%+ → possible dissociation
                 return True
         
         # Check classification
-        dissociation_count = sum(
-            1 for p in self.silence_periods 
-            if p.classification == SilenceType.DISSOCIATION
-        )
-        
-        return dissociation_count >= 2
+        return self._dissoc_ct >= 2
     
     def suggests_intervention(self) -> bool:
         """
@@ -329,9 +489,9 @@ class SilenceDurationAnalyzer:
             return True
         
         # Recent overwhelm
-        if self.silence_periods:
-            recent = self.silence_periods[-1]
-            if recent.classification == SilenceType.OVERWHELM:
+        if self._periods:
+            recent = self._periods[-1]
+            if recent.classification is _ST_OVERWHELM:
                 return True
         
         return False
@@ -351,22 +511,22 @@ class SilenceDurationAnalyzer:
         """
         current = self.current_silence_seconds()
         
-        if not self.silence_periods:
+        if not self._periods:
             # No history, use conservative default
             if current > 45:
                 return 0  # Prompt now
             return 45 - current
         
         # Analyze recent pattern
-        recent = self.silence_periods[-1]
+        recent = self._periods[-1]
         
-        if recent.classification == SilenceType.PROCESSING:
+        if recent.classification is _ST_PROCESSING:
             target = 50  # Mid-range for processing
-        elif recent.classification == SilenceType.CONTEMPLATION:
+        elif recent.classification is _ST_CONTEMPLATION:
             target = 75  # Give time for decision
-        elif recent.classification == SilenceType.DISSOCIATION:
+        elif recent.classification is _ST_DISSOCIATION:
             target = 90  # Attempt re-engagement
-        elif recent.classification == SilenceType.OVERWHELM:
+        elif recent.classification is _ST_OVERWHELM:
             target = 60  # Early supportive intervention
         else:
             target = 60  # Default
@@ -383,15 +543,17 @@ class SilenceDurationAnalyzer:
         Returns:
             Dictionary of aggregated metrics
         """
-        total_silence = sum(p.duration_seconds for p in self.silence_periods)
-        session_duration = (datetime.utcnow() - self.session_start).total_seconds()
+        durations = self._durations
+        count = len(durations)
+        total_silence = sum(durations)
+        session_duration = time.monotonic() - self._session_start_monotonic
         
         return {
             "total_silence_seconds": total_silence,
             "silence_percentage": (total_silence / session_duration * 100) if session_duration > 0 else 0,
-            "silence_period_count": len(self.silence_periods),
-            "average_silence_seconds": self.average_silence_duration(),
-            "longest_silence_seconds": self.longest_silence().duration_seconds if self.longest_silence() else 0,
+            "silence_period_count": count,
+            "average_silence_seconds": total_silence / count if count else 0.0,
+            "longest_silence_seconds": max(durations) if count else 0,
             "predominantly_processing": self.predominantly_processing(),
             "indicates_dissociation": self.indicates_dissociation(),
             "silence_by_type": self.silence_by_type()
@@ -412,7 +574,7 @@ class SilenceDurationAnalyzer:
             "suggests_intervention": self.suggests_intervention(),
             "optimal_prompt_timing": self.optimal_prompt_timing(),
             "session_metrics": self.session_metrics(),
-            "silence_periods": [p.to_dict() for p in self.silence_periods],
+            "silence_periods": [p.to_dict() for p in self._periods],
             "timestamp": datetime.utcnow().isoformat()
         }
 
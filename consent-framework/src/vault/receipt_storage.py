@@ -23,12 +23,20 @@ Author: Trust & Safety Engineering
 Status: PRODUCTION (CRITICAL)
 """
 
-import json
+import copy
 import hashlib
-from typing import Dict, List, Optional, Any
+import heapq
+import sys
+import time
+from collections import Counter, deque, namedtuple
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Set
 from datetime import datetime, timedelta
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+
+from .._jsoncodec import dumps as _json_dumps, loads as _json_loads
+from .._textengine import EPOCH
 
 
 class ArtifactType(Enum):
@@ -53,6 +61,44 @@ class RetentionClass(Enum):
     LEGAL_HOLD = "legal_hold"  # Cannot be deleted
 
 
+# Retention windows, measured from Artifact.created_at
+_TEMPORARY_RETENTION = timedelta(days=90)
+_STANDARD_RETENTION = timedelta(days=7*365)  # 7 years
+
+# Retention classes with a finite window (see Artifact.expires_at)
+_EXPIRING_CLASSES = frozenset((RetentionClass.TEMPORARY, RetentionClass.STANDARD))
+
+# Stale expiry-heap entries tolerated beyond the live ones before the
+# heap is rebuilt from storage
+_EXPIRY_HEAP_SLACK = 1024
+
+
+def _intern(value: Any) -> Any:
+    """Intern exact str values; anything else is returned unchanged."""
+    # sys.intern() rejects str subclasses and non-str values
+    return sys.intern(value) if type(value) is str else value
+
+
+def _slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10.
+    The field defaults are dropped from the class namespace (they would
+    shadow the slot descriptors); the generated ``__init__`` already
+    carries them.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class Artifact:
     """
@@ -77,46 +123,94 @@ class Artifact:
     
     def to_dict(self) -> Dict:
         """Serialize artifact for storage."""
-        data = asdict(self)
-        # Convert enums and datetime to strings
-        data['artifact_type'] = self.artifact_type.value
-        data['retention_class'] = self.retention_class.value
-        data['timestamp'] = self.timestamp.isoformat()
-        data['created_at'] = self.created_at.isoformat()
-        if self.last_accessed:
-            data['last_accessed'] = self.last_accessed.isoformat()
-        return data
+        # Built field by field rather than via asdict(), which recurses
+        # through every value; only the caller-supplied containers are
+        # copied, so the result never aliases the artifact's state
+        last_accessed = self.last_accessed
+        return {
+            'artifact_id': self.artifact_id,
+            'artifact_type': self.artifact_type.value,
+            'content': self.content,
+            'user_id': self.user_id,
+            'timestamp': self.timestamp.isoformat(),
+            'context': copy.deepcopy(self.context),
+            'retention_class': self.retention_class.value,
+            'tags': list(self.tags),
+            'created_at': self.created_at.isoformat(),
+            'accessed_count': self.accessed_count,
+            'last_accessed': (
+                last_accessed.isoformat() if last_accessed else last_accessed
+            )
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Artifact':
         """Deserialize artifact from storage."""
-        # Convert strings back to enums and datetime
-        data['artifact_type'] = ArtifactType(data['artifact_type'])
-        data['retention_class'] = RetentionClass(data['retention_class'])
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        if data.get('last_accessed'):
-            data['last_accessed'] = datetime.fromisoformat(data['last_accessed'])
-        return cls(**data)
+        # Fields are passed positionally in declaration order, converting
+        # strings back to enums and datetime; the caller's dict is left
+        # untouched
+        last_accessed = data.get('last_accessed')
+        if last_accessed:
+            last_accessed = datetime.fromisoformat(last_accessed)
+        return cls(
+            data['artifact_id'],
+            ArtifactType(data['artifact_type']),
+            data['content'],
+            data['user_id'],
+            datetime.fromisoformat(data['timestamp']),
+            data['context'],
+            RetentionClass(data['retention_class']),
+            data['tags'],
+            datetime.fromisoformat(data['created_at']),
+            data.get('accessed_count', 0),
+            last_accessed
+        )
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize artifact as compact UTF-8 JSON for storage.
+        
+        Uses orjson when installed; the bytes are the same either way.
+        """
+        return _json_dumps(self.to_dict())
+    
+    @classmethod
+    def from_json_bytes(cls, raw: bytes) -> 'Artifact':
+        """Deserialize artifact from to_json_bytes() output."""
+        return cls.from_dict(_json_loads(raw))
     
-    def should_expire(self) -> bool:
+    def should_expire(self, now: Optional[datetime] = None) -> bool:
         """
         Check if artifact should be deleted per retention policy.
         
+        Args:
+            now: Current time (naive UTC); read from the clock if omitted.
+                Batch callers pass one reading for every artifact.
+        
         Returns:
             True if artifact is past retention window
         """
-        if self.retention_class in (RetentionClass.INDEFINITE, RetentionClass.LEGAL_HOLD):
+        expiry = self.expires_at()
+        if expiry is None:
             return False
         
-        if self.retention_class == RetentionClass.TEMPORARY:
-            expiry = self.created_at + timedelta(days=90)
-        elif self.retention_class == RetentionClass.STANDARD:
-            expiry = self.created_at + timedelta(days=7*365)  # 7 years
-        else:
-            return False
+        if now is None:
+            now = datetime.utcnow()
+        return now > expiry
+    
+    def expires_at(self) -> Optional[datetime]:
+        """
+        End of the artifact's retention window.
         
-        return datetime.utcnow() > expiry
+        Returns:
+            Expiry time, or None if the retention class never expires
+        """
+        if self.retention_class == RetentionClass.TEMPORARY:
+            return self.created_at + _TEMPORARY_RETENTION
+        if self.retention_class == RetentionClass.STANDARD:
+            return self.created_at + _STANDARD_RETENTION
+        # INDEFINITE and LEGAL_HOLD
+        return None
     
     def generate_id(self) -> str:
         """
@@ -124,10 +218,65 @@ class Artifact:
         
         This allows deduplication - same content creates same ID.
         """
-        content_hash = hashlib.sha256(
-            f"{self.content}{self.user_id}{self.timestamp.isoformat()}".encode()
-        ).hexdigest()
-        return f"artifact_{content_hash[:16]}"
+        # An 8-byte BLAKE2b digest is exactly the 16 hex characters the
+        # ID carries, so nothing is computed only to be sliced away.
+        # Fields are fed separately (same digest as hashing their
+        # concatenation) so large content is not copied into a joined
+        # string first.
+        content_hash = hashlib.blake2b(
+            self.content.encode(), digest_size=8
+        )
+        content_hash.update(str(self.user_id).encode())
+        content_hash.update(self.timestamp.isoformat().encode())
+        return f"artifact_{content_hash.hexdigest()}"
+
+
+# One access-log row; get_access_log() hands these out as dicts. The
+# timestamp is integer microseconds since EPOCH, formatted on read, and
+# metadata is None (read back as {}) for events that carry none.
+AccessEvent = namedtuple(
+    'AccessEvent',
+    'event_type artifact_id user_id accessor timestamp metadata'
+)
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_micros(when: datetime) -> int:
+    """Microseconds from EPOCH to a naive UTC datetime."""
+    return (when - EPOCH) // _MICROSECOND
+
+
+def _event_dict(event: AccessEvent) -> Dict:
+    """Access-log row as the dict get_access_log() returns."""
+    data = event._asdict()
+    data["timestamp"] = (
+        EPOCH + timedelta(microseconds=event.timestamp)
+    ).isoformat()
+    if event.metadata is None:
+        data["metadata"] = {}
+    return data
+
+
+# Shared empty candidate set for filter values with no artifacts
+_NO_IDS: frozenset = frozenset()
+
+
+def _decrement(counter: Counter, key: Any):
+    """Decrement counter[key], dropping the key once it reaches zero."""
+    if counter[key] == 1:
+        del counter[key]
+    else:
+        counter[key] -= 1
+
+
+def _discard(index: Dict[Any, Set[str]], key: Any, artifact_id: str):
+    """Remove artifact_id from index[key], dropping the key once empty."""
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(artifact_id)
+        if not ids:
+            del index[key]
 
 
 class ReceiptVault:
@@ -163,16 +312,51 @@ class ReceiptVault:
         - Geographic distribution (compliance with data residency)
     """
     
-    def __init__(self, storage_backend: Optional[Any] = None):
+    def __init__(
+        self,
+        storage_backend: Optional[Any] = None,
+        log_cap: Optional[int] = None
+    ):
         """
         Initialize vault interface.
         
         Args:
             storage_backend: Optional custom storage backend
                 (defaults to in-memory for testing)
+            log_cap: Number of most recent events kept in access_log
+                (Default: None, keeps the full audit trail)
         """
         self.storage = storage_backend or {}  # In-memory storage for demo
-        self.access_log: List[Dict] = []
+        self.access_log: Deque[AccessEvent] = deque(maxlen=log_cap)
+        
+        # Secondary indexes for search(): field value -> artifact IDs.
+        # _indexed remembers the values each ID was indexed under, and
+        # _order its position in storage, so results keep storage order.
+        self._by_user: Dict[Optional[str], Set[str]] = {}
+        self._by_type: Dict[ArtifactType, Set[str]] = {}
+        self._by_retention: Dict[RetentionClass, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._indexed: Dict[str, tuple] = {}
+        # Stored artifacts per (user_id, tag) pair: an exact membership
+        # prefilter for user-scoped tag searches
+        self._user_tag_pairs: Dict[tuple, int] = {}
+        
+        # Running aggregates behind statistics()
+        self._count_by_type: Counter = Counter()
+        self._count_by_retention: Counter = Counter()
+        self._total_accesses = 0
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        
+        # Min-heap of (expiry, artifact_id) for artifacts with a finite
+        # retention window; entries are checked against storage when
+        # popped, so deletes and legal holds need not touch the heap
+        self._expiry_heap: List[tuple] = []
+        
+        for artifact in self.storage.values():
+            self._index(artifact)
+            self._schedule_expiry(artifact)
+            self._total_accesses += artifact.accessed_count
         
     def store(self, artifact: Artifact) -> str:
         """
@@ -191,8 +375,23 @@ class ReceiptVault:
         if not artifact.artifact_id:
             artifact.artifact_id = artifact.generate_id()
         
+        # Intern the strings that recur across artifacts and log events,
+        # so each distinct ID, user and tag is held once and compares by
+        # identity first in index lookups. Tags go into a new list so
+        # the caller's list is left alone.
+        artifact.artifact_id = _intern(artifact.artifact_id)
+        artifact.user_id = _intern(artifact.user_id)
+        if isinstance(artifact.tags, list):
+            artifact.tags = [_intern(tag) for tag in artifact.tags]
+        
         # Store artifact
+        previous = self.storage.get(artifact.artifact_id)
+        if previous is not None:
+            self._total_accesses -= previous.accessed_count
         self.storage[artifact.artifact_id] = artifact
+        self._total_accesses += artifact.accessed_count
+        self._index(artifact)
+        self._schedule_expiry(artifact)
         
         # Log storage event
         self._log_access(
@@ -225,6 +424,7 @@ class ReceiptVault:
             # Update access metadata
             artifact.accessed_count += 1
             artifact.last_accessed = datetime.utcnow()
+            self._total_accesses += 1
             
             # Log access
             self._log_access(
@@ -257,25 +457,54 @@ class ReceiptVault:
         Returns:
             List of matching artifacts
         """
-        results = []
-        
-        for artifact in self.storage.values():
-            # Apply filters
-            if user_id and artifact.user_id != user_id:
-                continue
-            if artifact_type and artifact.artifact_type != artifact_type:
-                continue
-            if retention_class and artifact.retention_class != retention_class:
-                continue
-            if tags and not any(tag in artifact.tags for tag in tags):
-                continue
-            
-            results.append(artifact)
-            
-            if len(results) >= limit:
-                break
-        
-        return results
+        # At least one match is returned even for limit < 1
+        limit = max(limit, 1)
+        
+        # Candidate ID sets, one per active filter
+        filters = []
+        if user_id:
+            filters.append(self._by_user.get(user_id, _NO_IDS))
+        if artifact_type:
+            filters.append(self._by_type.get(artifact_type, _NO_IDS))
+        if retention_class:
+            filters.append(self._by_retention.get(retention_class, _NO_IDS))
+        if tags:
+            if user_id and not any(
+                (user_id, tag) in self._user_tag_pairs for tag in tags
+            ):
+                return []
+            # Any tag may match
+            tag_ids = [self._by_tag.get(tag, _NO_IDS) for tag in set(tags)]
+            tag_total = sum(map(len, tag_ids))
+            if not filters or tag_total <= min(map(len, filters)):
+                filters.append(set().union(*tag_ids))
+                tags = None
+        elif not filters:
+            return list(islice(self.storage.values(), limit))
+        
+        if len(filters) == 1:
+            # Single-filter queries (the common dashboard shape) read the
+            # index set directly; nothing below mutates it
+            matches = filters[0]
+        else:
+            # Intersect starting from the most selective filter
+            filters.sort(key=len)
+            matches = filters[0].intersection(*filters[1:])
+        
+        if tags:
+            # The tag sets are larger than the other filters' result, so
+            # check each remaining candidate's indexed tags instead of
+            # building their union
+            tag_set = set(tags)
+            indexed = self._indexed
+            matches = [
+                artifact_id for artifact_id in matches
+                if not tag_set.isdisjoint(indexed[artifact_id][3])
+            ]
+        
+        # First matches in storage order
+        first = heapq.nsmallest(limit, matches, key=self._order.__getitem__)
+        return [self.storage[artifact_id] for artifact_id in first]
     
     def delete(self, artifact_id: str, reason: str, approver: Optional[str] = None) -> bool:
         """
@@ -317,6 +546,9 @@ class ReceiptVault:
         
         # Remove from storage
         del self.storage[artifact_id]
+        self._total_accesses -= artifact.accessed_count
+        self._unindex(artifact_id)
+        del self._order[artifact_id]
         
         return True
     
@@ -330,21 +562,55 @@ class ReceiptVault:
         Note:
             This is typically run as a scheduled job.
             Artifacts on legal hold or indefinite retention are skipped.
+            The sweep is logged as a single BULK_EXPIRE event whose
+            metadata lists the deleted artifact IDs ("artifact_ids") and
+            their (artifact_id, user_id) pairs ("artifacts").
         """
-        expired_ids = [
-            artifact_id
-            for artifact_id, artifact in self.storage.items()
-            if artifact.should_expire()
-        ]
+        now = datetime.utcnow()
+        heap = self._expiry_heap
+        expired_ids = set()
         
-        for artifact_id in expired_ids:
-            self.delete(
-                artifact_id=artifact_id,
-                reason="retention_policy_expired",
-                approver="system_automated"
-            )
+        # Only entries whose expiry has passed are popped
+        while heap and heap[0][0] < now:
+            _, artifact_id = heapq.heappop(heap)
+            artifact = self.storage.get(artifact_id)
+            if artifact is None:
+                continue  # Already deleted
+            # The stored artifact may have been replaced or put on legal
+            # hold since this entry was pushed
+            if artifact.should_expire(now):
+                expired_ids.add(artifact_id)
+        
+        if not expired_ids:
+            return 0
+        
+        # Everything popped above has a finite retention class, so none
+        # is on legal hold: skip delete()'s checks and per-row logging
+        expired = sorted(expired_ids, key=self._order.__getitem__)
+        owners = []
+        storage = self.storage
+        for artifact_id in expired:
+            artifact = storage.pop(artifact_id)
+            owners.append((artifact_id, artifact.user_id))
+            self._total_accesses -= artifact.accessed_count
+            self._unindex(artifact_id)
+            del self._order[artifact_id]
+        
+        # One audit event for the sweep, listing every ID in storage order
+        # and, as per-artifact DELETE events did, the user it belonged to
+        self._log_access(
+            event_type="BULK_EXPIRE",
+            artifact_id=None,
+            metadata={
+                "reason": "retention_policy_expired",
+                "approver": "system_automated",
+                "count": len(expired),
+                "artifact_ids": expired,
+                "artifacts": owners
+            }
+        )
         
-        return len(expired_ids)
+        return len(expired)
     
     def apply_legal_hold(self, artifact_ids: List[str], case_id: str) -> int:
         """
@@ -363,6 +629,7 @@ class ReceiptVault:
             artifact = self.storage.get(artifact_id)
             if artifact:
                 artifact.retention_class = RetentionClass.LEGAL_HOLD
+                self._index(artifact)
                 artifact.context['legal_hold'] = {
                     'case_id': case_id,
                     'applied_at': datetime.utcnow().isoformat()
@@ -377,6 +644,76 @@ class ReceiptVault:
         
         return protected
     
+    def _index(self, artifact: Artifact):
+        """(Re)index a stored artifact under its current field values."""
+        artifact_id = artifact.artifact_id
+        if artifact_id in self._indexed:
+            self._unindex(artifact_id)
+        if artifact_id not in self._order:
+            self._order[artifact_id] = self._next_order
+            self._next_order += 1
+        
+        tags = tuple(artifact.tags)
+        self._count_by_type[artifact.artifact_type] += 1
+        self._count_by_retention[artifact.retention_class] += 1
+        self._by_user.setdefault(artifact.user_id, set()).add(artifact_id)
+        self._by_type.setdefault(artifact.artifact_type, set()).add(artifact_id)
+        self._by_retention.setdefault(
+            artifact.retention_class, set()
+        ).add(artifact_id)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(artifact_id)
+        pairs = self._user_tag_pairs
+        for tag in set(tags):
+            key = (artifact.user_id, tag)
+            pairs[key] = pairs.get(key, 0) + 1
+        self._indexed[artifact_id] = (
+            artifact.user_id,
+            artifact.artifact_type,
+            artifact.retention_class,
+            tags
+        )
+    
+    def _schedule_expiry(self, artifact: Artifact):
+        """Queue a stored artifact for expire_old_artifacts()."""
+        expiry = artifact.expires_at()
+        if expiry is None:
+            return
+        heap = self._expiry_heap
+        heapq.heappush(heap, (expiry, artifact.artifact_id))
+        
+        # Deletes, replacements and legal holds leave stale entries
+        # behind; rebuild once they outnumber the live ones
+        counts = self._count_by_retention
+        live = counts[RetentionClass.TEMPORARY] + counts[RetentionClass.STANDARD]
+        if len(heap) > 2 * live + _EXPIRY_HEAP_SLACK:
+            heap[:] = [
+                (artifact.expires_at(), artifact_id)
+                for artifact_id, artifact in self.storage.items()
+                if artifact.retention_class in _EXPIRING_CLASSES
+            ]
+            heapq.heapify(heap)
+    
+    def _unindex(self, artifact_id: str):
+        """Drop an artifact ID from the secondary indexes."""
+        user_id, artifact_type, retention_class, tags = self._indexed.pop(
+            artifact_id
+        )
+        _decrement(self._count_by_type, artifact_type)
+        _decrement(self._count_by_retention, retention_class)
+        _discard(self._by_user, user_id, artifact_id)
+        _discard(self._by_type, artifact_type, artifact_id)
+        _discard(self._by_retention, retention_class, artifact_id)
+        for tag in tags:
+            _discard(self._by_tag, tag, artifact_id)
+        pairs = self._user_tag_pairs
+        for tag in set(tags):
+            key = (user_id, tag)
+            if pairs[key] == 1:
+                del pairs[key]
+            else:
+                pairs[key] -= 1
+    
     def _log_access(
         self,
         event_type: str,
@@ -394,16 +731,14 @@ class ReceiptVault:
         - What operation was performed
         - Why (if deletion or legal hold)
         """
-        event = {
-            "event_type": event_type,
-            "artifact_id": artifact_id,
-            "user_id": user_id,
-            "accessor": accessor,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
-        }
-        
-        self.access_log.append(event)
+        self.access_log.append(AccessEvent(
+            event_type,
+            artifact_id,
+            user_id,
+            accessor,
+            time.time_ns() // 1000,
+            metadata
+        ))
     
     def get_access_log(
         self,
@@ -424,17 +759,20 @@ class ReceiptVault:
         """
         results = []
         
+        since_micros = _epoch_micros(since) if since else None
+        
         for event in self.access_log:
-            if artifact_id and event['artifact_id'] != artifact_id:
+            if artifact_id and event.artifact_id != artifact_id:
+                # Expiry sweeps log their IDs in one event
+                if not (event.event_type == "BULK_EXPIRE" and
+                        artifact_id in event.metadata["artifact_ids"]):
+                    continue
+            if event_type and event.event_type != event_type:
                 continue
-            if event_type and event['event_type'] != event_type:
+            if since_micros is not None and event.timestamp < since_micros:
                 continue
-            if since:
-                event_time = datetime.fromisoformat(event['timestamp'])
-                if event_time < since:
-                    continue
             
-            results.append(event)
+            results.append(_event_dict(event))
         
         return results
     
@@ -445,29 +783,28 @@ class ReceiptVault:
         Returns:
             Dictionary of aggregate metrics
         """
-        artifacts = list(self.storage.values())
+        total_artifacts = len(self.storage)
         
-        if not artifacts:
+        if not total_artifacts:
             return {"total_artifacts": 0}
         
-        # Count by type
-        by_type = {}
-        for artifact in artifacts:
-            atype = artifact.artifact_type.value
-            by_type[atype] = by_type.get(atype, 0) + 1
-        
-        # Count by retention class
-        by_retention = {}
-        for artifact in artifacts:
-            rclass = artifact.retention_class.value
-            by_retention[rclass] = by_retention.get(rclass, 0) + 1
+        # Aggregates are maintained by store/retrieve/delete/legal hold/
+        # expiry, so this is independent of vault size
+        by_type = {
+            atype.value: count
+            for atype, count in self._count_by_type.items()
+        }
+        by_retention = {
+            rclass.value: count
+            for rclass, count in self._count_by_retention.items()
+        }
         
         # Access statistics
-        total_accesses = sum(a.accessed_count for a in artifacts)
-        avg_accesses = total_accesses / len(artifacts) if artifacts else 0
+        total_accesses = self._total_accesses
+        avg_accesses = total_accesses / total_artifacts
         
         return {
-            "total_artifacts": len(artifacts),
+            "total_artifacts": total_artifacts,
             "by_type": by_type,
             "by_retention_class": by_retention,
             "total_accesses": total_accesses,
@@ -0,0 +1,20 @@
+"""
+Shared test configuration.
+
+The source tree under src/ is the rlty_consent package. When it is not
+installed, expose src/ under that name so the modules' relative
+imports resolve the same way they do in a packaged build.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+try:
+    import rlty_consent  # noqa: F401
+except ImportError:
+    _package = types.ModuleType("rlty_consent")
+    _package.__path__ = [str(SRC)]
+    sys.modules["rlty_consent"] = _package
@@ -0,0 +1,33 @@
+"""
+Bargaining Event Logger Tests
+
+The logger keeps per-type tallies alongside its event list, so the
+list is only exposed as a copy.
+"""
+
+import pytest
+
+from rlty_consent.metrics.bargaining_events import BargainingEventLogger
+
+
+class TestLoggedEvents:
+    """events is a snapshot; tallies follow log_text()/log_event()."""
+    
+    def _logger(self):
+        logger = BargainingEventLogger(user_id="u1", session_id="s1")
+        logger.log_event("behavioral", "I'll be better")
+        logger.log_event("commitment", "I promise")
+        return logger
+    
+    def test_returned_list_is_a_copy(self):
+        logger = self._logger()
+        logger.events.clear()
+        assert logger.event_count() == 2
+        assert len(logger.events) == 2
+        by_type = logger.to_metric()["events_by_type"]
+        assert by_type["behavioral"] == by_type["commitment"] == 1
+    
+    def test_attribute_cannot_be_replaced(self):
+        logger = self._logger()
+        with pytest.raises(AttributeError):
+            logger.events = []
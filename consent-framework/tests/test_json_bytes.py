@@ -0,0 +1,118 @@
+"""
+Compact JSON Encoding Tests
+
+Artifact and ValidationResult serialize through orjson when it is
+installed and through the stdlib encoder otherwise. Stored bytes must
+not depend on which one ran, so every payload below is encoded on both
+paths and compared against json.dumps with compact separators.
+"""
+
+import json
+from datetime import datetime
+from enum import Enum, IntEnum
+
+import pytest
+
+from rlty_consent import _jsoncodec
+from rlty_consent.consent.invariant import ValidationResult
+from rlty_consent.vault.receipt_storage import (
+    Artifact,
+    ArtifactType,
+    RetentionClass,
+)
+
+
+class _Label(str, Enum):
+    DRAFT = "draft"
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
+CONTEXTS = [
+    {},
+    {"channel": "sms", "attempts": 3, "flagged": False, "note": None},
+    # Non-str keys: json.dumps converts them, plain orjson raises
+    {1: "x", 2.5: "y", None: "n"},
+    {True: "yes", False: "no"},
+    # Non-finite floats: orjson writes null, json.dumps writes NaN
+    {"score": float("nan"), "upper": float("inf"), "lower": float("-inf")},
+    # Exponent formatting: orjson writes 1e16, json.dumps 1e+16
+    {"big": 1e16, "small": 1e-07, "tiny": 5e-324, "plain": 0.1},
+    {1e16: "float key"},
+    # Integers beyond 64 bits: orjson raises
+    {"id": 2 ** 70, "negative": -2 ** 63 - 1, "edge": 2 ** 64 - 1},
+    # Subclasses of JSON types
+    {"label": _Label.DRAFT, "level": _Level.HIGH, _Label.DRAFT: 1},
+    # Escapes and non-ASCII text
+    {"text": "line\nbreak\ttab\x00nul\x7f  caf\xe9 \U0001f600"},
+    {"nested": [[{"a": (1, 2)}]] * 3, "tuple": (1.5, "two", None)},
+]
+
+
+def _reference(payload):
+    return json.dumps(
+        payload, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _artifact(context):
+    return Artifact(
+        artifact_id="art_1",
+        artifact_type=ArtifactType.UNSENT_MESSAGE,
+        content="I never sent this — caf\xe9",
+        user_id="u1",
+        timestamp=datetime(2024, 1, 2, 3, 4, 5, 6),
+        context=context,
+        retention_class=RetentionClass.STANDARD,
+        tags=["draft", "\xe9t\xe9"],
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        accessed_count=2,
+        last_accessed=datetime(2024, 2, 1)
+    )
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Serialize with and without orjson."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_jsoncodec, "orjson", None)
+    elif _jsoncodec.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestArtifactJson:
+    """Artifact.to_json_bytes() output does not depend on orjson."""
+    
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_matches_stdlib(self, encoder, context):
+        artifact = _artifact(context)
+        assert artifact.to_json_bytes() == _reference(artifact.to_dict())
+    
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_round_trip(self, encoder, context):
+        raw = _artifact(context).to_json_bytes()
+        restored = Artifact.from_json_bytes(raw)
+        assert restored.to_json_bytes() == raw
+    
+    def test_long_integers_survive_round_trip(self, encoder):
+        raw = _artifact({"id": 2 ** 70, "edge": 2 ** 64 - 1}).to_json_bytes()
+        restored = Artifact.from_json_bytes(raw)
+        assert restored.context == {"id": 2 ** 70, "edge": 2 ** 64 - 1}
+        assert type(restored.context["edge"]) is int
+
+
+class TestValidationResultJson:
+    """ValidationResult.to_json_bytes() output does not depend on orjson."""
+    
+    def test_matches_stdlib(self, encoder):
+        result = ValidationResult()
+        result.add_validation("freely_given", False, "Consent not fr\xe9ely given")
+        result.add_validation("informed", True, "ok\n")
+        assert result.to_json_bytes() == _reference(result.to_dict())
+    
+    def test_empty_matches_stdlib(self, encoder):
+        result = ValidationResult()
+        assert result.to_json_bytes() == _reference(result.to_dict())
@@ -0,0 +1,138 @@
+"""
+Literal Prefilter Regression Tests
+
+The normalizer and the bargaining logger skip rules whose literals
+are absent from the casefolded text, and the normalizer can narrow
+candidates further with an RE2 set. These gates must never drop a
+match that the plain IGNORECASE patterns would find, so every case
+below is checked against a brute-force reference over the original
+pattern tables.
+
+Inputs focus on characters where casefold() and IGNORECASE disagree
+or where \\s and \\b behave differently outside ASCII.
+"""
+
+import re
+
+import pytest
+
+from rlty_consent.consent import normalization
+from rlty_consent.consent.normalization import ConsentNormalizer
+from rlty_consent.metrics import bargaining_events
+from rlty_consent.metrics.bargaining_events import BargainingEventLogger
+
+
+CASEFOLD_SENSITIVE_TEXTS = [
+    # Turkish dotless / dotted i: IGNORECASE folds both to "i"
+    "We need you fully \u0131nformed first",
+    "FULLY \u0130NFORMED CONSENT IS REQUIRED",
+    "\u0131nformed consent and freely g\u0131ven",
+    "\u0131'll pay anything, \u0131 promise \u0131'll be better",
+    # Long s: IGNORECASE matches it as "s"
+    "con\u017fent must be freely given",
+    "Check the box to opt-in, plea\u017fe",
+    "I'm begging, I can't \u017furvive without it",
+    # Kelvin sign: IGNORECASE matches it as "k"
+    "Chec\u212a the box to continue",
+    "with full \u212anowledge of the terms",
+    "can we wor\u212a something out",
+    # No-break space: \s matches it, a literal space does not
+    "users freely\xa0give their data",
+    "fully\xa0informed",
+    "just\xa0one more minute",
+    # Non-ASCII word characters next to a literal defeat \b
+    "\xe9fully informed",
+    "fully informed\xe9",
+    "informed consent\xdf and opt-in",
+    # Plain ASCII controls
+    "Informed consent is freely given with meaningful alternative",
+    "Just one more minute, I'll pay anything, I'm begging",
+    "nothing to see here",
+    "",
+]
+
+
+def _reference_normalize(text):
+    """Baseline normalize(): every rule in order, plain IGNORECASE re."""
+    normalized = text
+    applied = []
+    for pattern, replacement, rule in ConsentNormalizer.NORMALIZATION_PATTERNS:
+        compiled = re.compile(pattern, re.IGNORECASE)
+        if compiled.search(normalized):
+            normalized = compiled.sub(replacement, normalized)
+            applied.append(rule.value)
+    return normalized, applied
+
+
+def _reference_findings(text):
+    """Baseline detect_problematic_language()."""
+    return [
+        (match, replacement)
+        for pattern, replacement, _ in ConsentNormalizer.NORMALIZATION_PATTERNS
+        for match in re.findall(pattern, text, re.IGNORECASE)
+    ]
+
+
+def _reference_bargaining(text):
+    """Baseline log_text(): (type, confidence) per matching type."""
+    events = []
+    for btype, patterns in BargainingEventLogger.PATTERNS.items():
+        for pattern in patterns:
+            matches = re.findall(pattern, text, re.IGNORECASE)
+            if matches:
+                events.append((btype, min(0.9, 0.6 + len(matches) * 0.1)))
+                break
+    return events
+
+
+@pytest.fixture(params=["rule_set", "literals_only"])
+def normalizer(request, monkeypatch):
+    """A normalizer with and without the RE2 rule-set gate."""
+    if request.param == "literals_only":
+        monkeypatch.setattr(normalization, "_RULE_SET", None)
+    normalization._normalize_pure.cache_clear()
+    yield ConsentNormalizer()
+    normalization._normalize_pure.cache_clear()
+
+
+@pytest.fixture(params=["hyperscan", "literals_only"])
+def bargaining_logger(request, monkeypatch):
+    """A bargaining logger with and without the Hyperscan database."""
+    if request.param == "literals_only":
+        monkeypatch.setattr(bargaining_events, "_HYPERSCAN_DB", None)
+    return BargainingEventLogger(user_id="u1", session_id="s1")
+
+
+class TestNormalizerPrefilter:
+    """The normalizer's literal and rule-set gates keep every match."""
+    
+    @pytest.mark.parametrize("text", CASEFOLD_SENSITIVE_TEXTS)
+    def test_normalize_matches_reference(self, normalizer, text):
+        result = normalizer.normalize(text)
+        assert (result.normalized, result.rules_applied) == _reference_normalize(text)
+    
+    @pytest.mark.parametrize("text", CASEFOLD_SENSITIVE_TEXTS)
+    def test_detect_problematic_language_matches_reference(self, normalizer, text):
+        assert normalizer.detect_problematic_language(text) == _reference_findings(text)
+    
+    @pytest.mark.parametrize("text", CASEFOLD_SENSITIVE_TEXTS)
+    def test_validate_normalized_matches_reference(self, normalizer, text):
+        assert normalizer.validate_normalized(text) == (not _reference_findings(text))
+    
+    def test_dotless_i_is_rewritten(self, normalizer):
+        """Regression: the prefilter once rejected "\u0131nformed"."""
+        result = normalizer.normalize("fully \u0131nformed")
+        assert result.normalized == "aware"
+
+
+class TestBargainingPrefilter:
+    """The bargaining logger's literal gate keeps every detected type."""
+    
+    @pytest.mark.parametrize("text", CASEFOLD_SENSITIVE_TEXTS)
+    def test_log_text_matches_reference(self, bargaining_logger, text):
+        bargaining_logger.log_text(text)
+        logged = [
+            (event.event_type, event.confidence)
+            for event in bargaining_logger.events
+        ]
+        assert logged == _reference_bargaining(text)
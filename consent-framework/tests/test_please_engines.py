@@ -0,0 +1,147 @@
+"""
+Please Counting Engine Equivalence Tests
+
+_count_please() and PleaseFrequencyTracker.record_batch() scan ASCII
+text with Hyperscan, an Aho-Corasick automaton or a lowercased ASCII
+regex, whichever is available. Each engine must count exactly what
+the IGNORECASE _PLEASE_RE finds, so every case below runs with the
+optional engines switched off one at a time.
+
+Inputs focus on characters where IGNORECASE, str.lower() and \\b
+behave differently outside ASCII.
+"""
+
+import pytest
+
+from rlty_consent.metrics import please_frequency
+from rlty_consent.metrics.please_frequency import (
+    PleaseFrequencyTracker,
+    _PLEASE_RE,
+    _count_please,
+)
+
+
+PLEASE_TEXTS = [
+    # Plain ASCII variants and word boundaries
+    "please",
+    "Please, PLEASE, pLeAsE",
+    "pls plz pleas pleaes",
+    "pleasee pleaser displease pleasing",
+    "please_ please1 _please 1please",
+    "please-please.please!please?",
+    "plz\tpls\nplease\x0bpleas",
+    # Long s: IGNORECASE matches it as "s"
+    "plea\u017fe",
+    "PLEA\u017fE and p\u017f",
+    # Kelvin sign next to a match
+    "\u212aplease please\u212a",
+    # Turkish dotted / dotless i change length or word status when lowered
+    "\u0130please",
+    "please\u0130",
+    "pleas\u0131",
+    # Fullwidth letters are word characters but never match
+    "\uff50\uff4c\uff45\uff41\uff53\uff45",
+    "\uff50please",
+    # Non-ASCII word characters next to a literal defeat \b
+    "\xe9please",
+    "please\xe9",
+    "caf\xe9 please",
+    # Ligatures and no-break space
+    "\ufb00 please \ufb00",
+    "please\xa0please",
+    # Controls
+    "nothing to see here",
+    "",
+]
+
+
+@pytest.fixture(params=["hyperscan", "ahocorasick", "lowered_regex"])
+def engine(request, monkeypatch):
+    """Disable every optional engine ranked above the one under test."""
+    if request.param in ("ahocorasick", "lowered_regex"):
+        monkeypatch.setattr(please_frequency, "_PLEASE_DB", None)
+    if request.param == "lowered_regex":
+        monkeypatch.setattr(please_frequency, "_PLEASE_AUTOMATON", None)
+    return request.param
+
+
+class TestCountPlease:
+    """_count_please() agrees with _PLEASE_RE on every engine."""
+    
+    @pytest.mark.parametrize("text", PLEASE_TEXTS)
+    def test_count_matches_regex(self, engine, text):
+        assert _count_please(text) == len(_PLEASE_RE.findall(text))
+    
+    @pytest.mark.parametrize("text", PLEASE_TEXTS)
+    def test_record_utterance_matches_regex(self, engine, text):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_utterance(text)
+        assert tracker.frequency() == len(_PLEASE_RE.findall(text))
+
+
+class TestRecordBatch:
+    """record_batch() attributes every match to the right utterance."""
+    
+    def _expected(self, texts):
+        counts = [len(_PLEASE_RE.findall(text)) for text in texts]
+        return [(text, count) for text, count in zip(texts, counts) if count]
+    
+    def _recorded(self, tracker):
+        return [
+            (utterance["text"], utterance["please_count"])
+            for utterance in tracker.utterances
+        ]
+    
+    def test_batch_matches_regex(self, engine):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_batch(PLEASE_TEXTS)
+        assert self._recorded(tracker) == self._expected(PLEASE_TEXTS)
+    
+    def test_ascii_batch_matches_regex(self, engine):
+        texts = [text for text in PLEASE_TEXTS if text.isascii()]
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_batch(texts)
+        assert self._recorded(tracker) == self._expected(texts)
+    
+    @pytest.mark.parametrize("text", PLEASE_TEXTS)
+    def test_single_text_batch_matches_record_utterance(self, engine, text):
+        batched = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        batched.record_batch([text])
+        single = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        single.record_utterance(text)
+        assert self._recorded(batched) == self._recorded(single)
+    
+    def test_store_matches_keeps_matched_strings(self, engine):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_batch(PLEASE_TEXTS, store_matches=True)
+        assert [
+            utterance["matches"] for utterance in tracker.utterances
+        ] == [
+            _PLEASE_RE.findall(text)
+            for text in PLEASE_TEXTS
+            if _PLEASE_RE.search(text)
+        ]
+
+
+class TestStoreMatches:
+    """Matched strings are kept only on request, outside the context."""
+    
+    def test_record_utterance_keeps_matches_on_request(self):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        context = {"message_type": "chat"}
+        tracker.record_utterance("Please, pls", context, store_matches=True)
+        (utterance,) = tracker.utterances
+        assert utterance["matches"] == ["Please", "pls"]
+        assert utterance["context"] == {"message_type": "chat"}
+    
+    def test_matches_are_omitted_by_default(self):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_utterance("please")
+        tracker.record_batch(["plz"])
+        assert all("matches" not in u for u in tracker.utterances)
+    
+    def test_returned_matches_are_copies(self):
+        tracker = PleaseFrequencyTracker(user_id="u1", session_id="s1")
+        tracker.record_utterance("please", store_matches=True)
+        tracker.utterances[0]["matches"].clear()
+        assert tracker.utterances[0]["matches"] == ["please"]
@@ -0,0 +1,273 @@
+"""
+Receipt Vault Index Tests
+
+search() and statistics() read secondary indexes and running
+aggregates, and expire_old_artifacts() pops a heap, instead of
+scanning storage. Random sequences of vault operations are checked
+step by step against brute-force scans of vault.storage.
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from rlty_consent.vault import receipt_storage
+from rlty_consent.vault.receipt_storage import (
+    Artifact,
+    ArtifactType,
+    ReceiptVault,
+    RetentionClass,
+)
+
+
+USERS = ["u1", "u2", "u3", None]
+TAGS = ["apology", "family", "regret", "work", "draft"]
+START = datetime(2030, 1, 1)
+
+
+class _Clock(datetime):
+    """datetime whose utcnow() is set by the test."""
+    
+    now = START
+    
+    @classmethod
+    def utcnow(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(_Clock, "now", START)
+    monkeypatch.setattr(receipt_storage, "datetime", _Clock)
+    return _Clock
+
+
+def _reference_search(vault, user_id, artifact_type, tags, retention_class,
+                      limit):
+    """Baseline search(): a filtered scan of storage in order."""
+    results = []
+    for artifact in vault.storage.values():
+        if user_id and artifact.user_id != user_id:
+            continue
+        if artifact_type and artifact.artifact_type != artifact_type:
+            continue
+        if retention_class and artifact.retention_class != retention_class:
+            continue
+        if tags and not any(tag in artifact.tags for tag in tags):
+            continue
+        results.append(artifact)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _reference_statistics(vault):
+    """Baseline statistics(): counts recomputed from storage."""
+    artifacts = list(vault.storage.values())
+    if not artifacts:
+        return {"total_artifacts": 0}
+    by_type = {}
+    by_retention = {}
+    for artifact in artifacts:
+        atype = artifact.artifact_type.value
+        by_type[atype] = by_type.get(atype, 0) + 1
+        rclass = artifact.retention_class.value
+        by_retention[rclass] = by_retention.get(rclass, 0) + 1
+    total_accesses = sum(a.accessed_count for a in artifacts)
+    return {
+        "total_artifacts": len(artifacts),
+        "by_type": by_type,
+        "by_retention_class": by_retention,
+        "total_accesses": total_accesses,
+        "average_accesses_per_artifact": total_accesses / len(artifacts),
+        "access_log_size": len(vault.access_log)
+    }
+
+
+class _Fuzzer:
+    """Drives a vault with random operations and checks each step."""
+    
+    def __init__(self, seed, clock):
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.vault = ReceiptVault()
+        self.serial = 0
+        self.rebuilds = 0
+    
+    def _artifact(self, artifact_id=None):
+        rng = self.rng
+        self.serial += 1
+        return Artifact(
+            artifact_id=artifact_id or f"a{self.serial}",
+            artifact_type=rng.choice(list(ArtifactType)),
+            content=f"content {self.serial}",
+            user_id=rng.choice(USERS),
+            timestamp=self.clock.now,
+            context={},
+            retention_class=rng.choice(list(RetentionClass)),
+            tags=rng.choices(TAGS, k=rng.randint(0, 3)),
+            created_at=self.clock.now - timedelta(
+                days=rng.randint(0, 8 * 365)
+            ),
+            accessed_count=rng.randint(0, 3)
+        )
+    
+    def _some_id(self):
+        ids = list(self.vault.storage)
+        if not ids or self.rng.random() < 0.1:
+            return "missing"
+        return self.rng.choice(ids)
+    
+    def store(self):
+        vault = self.vault
+        replace = vault.storage and self.rng.random() < 0.3
+        artifact = self._artifact(self._some_id() if replace else None)
+        before = len(vault._expiry_heap)
+        vault.store(artifact)
+        heap = vault._expiry_heap
+        if len(heap) < before:
+            self.rebuilds += 1
+        if artifact.expires_at() is not None:
+            # The heap only grows on these pushes, which bound its size
+            counts = vault._count_by_retention
+            live = (
+                counts[RetentionClass.TEMPORARY]
+                + counts[RetentionClass.STANDARD]
+            )
+            assert len(heap) <= 2 * live + receipt_storage._EXPIRY_HEAP_SLACK
+    
+    def delete(self):
+        vault = self.vault
+        artifact_id = self._some_id()
+        artifact = vault.storage.get(artifact_id)
+        expected = artifact is not None and (
+            artifact.retention_class != RetentionClass.LEGAL_HOLD
+        )
+        assert vault.delete(artifact_id, reason="test") == expected
+        assert (artifact_id in vault.storage) == (
+            artifact is not None and not expected
+        )
+    
+    def retrieve(self):
+        vault = self.vault
+        artifact_id = self._some_id()
+        assert (vault.retrieve(artifact_id) is not None) == (
+            artifact_id in vault.storage
+        )
+    
+    def legal_hold(self):
+        vault = self.vault
+        ids = [self._some_id() for _ in range(self.rng.randint(1, 3))]
+        expected = sum(artifact_id in vault.storage for artifact_id in ids)
+        assert vault.apply_legal_hold(ids, case_id="LH-TEST") == expected
+    
+    def expire(self):
+        vault = self.vault
+        self.clock.now += timedelta(days=self.rng.randint(0, 400))
+        now = self.clock.now
+        expected = [
+            artifact_id for artifact_id, artifact in vault.storage.items()
+            if artifact.should_expire(now)
+        ]
+        owners = [
+            (artifact_id, vault.storage[artifact_id].user_id)
+            for artifact_id in expected
+        ]
+        assert vault.expire_old_artifacts() == len(expected)
+        assert not any(artifact_id in vault.storage for artifact_id in expected)
+        if expected:
+            event = vault.access_log[-1]
+            assert event.event_type == "BULK_EXPIRE"
+            assert event.metadata["artifact_ids"] == expected
+            assert event.metadata["artifacts"] == owners
+    
+    def check(self):
+        vault = self.vault
+        rng = self.rng
+        for _ in range(5):
+            query = {
+                "user_id": rng.choice(USERS + [None, "nobody"]),
+                "artifact_type": rng.choice(list(ArtifactType) + [None] * 4),
+                "tags": rng.choice([
+                    None, [], rng.choices(TAGS + ["unused"], k=rng.randint(1, 3))
+                ]),
+                "retention_class": rng.choice(
+                    list(RetentionClass) + [None] * 2
+                ),
+                "limit": rng.choice([0, 1, 3, 100])
+            }
+            expected = _reference_search(vault, **query)
+            assert [a.artifact_id for a in vault.search(**query)] == [
+                a.artifact_id for a in expected
+            ]
+        assert vault.statistics() == _reference_statistics(vault)
+    
+    def run(self, steps):
+        operations = [
+            (self.store, 5),
+            (self.delete, 2),
+            (self.retrieve, 1),
+            (self.legal_hold, 1),
+            (self.expire, 1),
+        ]
+        actions, weights = zip(*operations)
+        for _ in range(steps):
+            self.rng.choices(actions, weights)[0]()
+            self.check()
+
+
+class TestRandomOperations:
+    """Indexed queries agree with a scan after any operation sequence."""
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force(self, clock, seed):
+        _Fuzzer(seed, clock).run(300)
+    
+    @pytest.mark.parametrize("seed", range(10))
+    def test_expiry_heap_rebuild(self, clock, monkeypatch, seed):
+        # A small slack forces frequent rebuilds of the expiry heap
+        monkeypatch.setattr(receipt_storage, "_EXPIRY_HEAP_SLACK", 0)
+        fuzzer = _Fuzzer(seed, clock)
+        fuzzer.run(300)
+        assert fuzzer.rebuilds > 0
+
+
+class TestStoreInterning:
+    """store() interns IDs and tags without touching caller objects."""
+    
+    def _artifact(self, user_id="u1", tags=None):
+        return Artifact(
+            artifact_id="a1",
+            artifact_type=ArtifactType.UNSENT_MESSAGE,
+            content="content",
+            user_id=user_id,
+            timestamp=START,
+            context={},
+            retention_class=RetentionClass.INDEFINITE,
+            tags=tags if tags is not None else [],
+            created_at=START
+        )
+    
+    def test_caller_tag_list_is_not_mutated(self):
+        tags = ["".join(["apo", "logy"])]
+        artifact = self._artifact(tags=tags)
+        ReceiptVault().store(artifact)
+        assert artifact.tags is not tags
+        assert artifact.tags == tags
+    
+    def test_tags_are_interned(self):
+        artifact = self._artifact(tags=["".join(["apo", "logy"])])
+        ReceiptVault().store(artifact)
+        assert artifact.tags[0] is sys.intern("apology")
+    
+    def test_non_str_values_are_kept(self):
+        class Tag(str):
+            pass
+        
+        tags = [Tag("family"), 7, None]
+        vault = ReceiptVault()
+        vault.store(self._artifact(user_id=12345, tags=tags))
+        assert vault.search(tags=[7]) and vault.search(user_id=12345)
+        assert tags == ["family", 7, None]
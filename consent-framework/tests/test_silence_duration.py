@@ -0,0 +1,97 @@
+"""
+Silence Duration Analyzer Tests
+
+The analyzer times the periods it opens on time.monotonic(), but its
+public attributes still accept wall-clock SilencePeriod objects built
+by callers. These tests cover the mix of the two.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from rlty_consent.metrics.silence_duration import (
+    SilenceDurationAnalyzer,
+    SilencePeriod,
+    SilenceType,
+)
+
+
+class TestWallClockPeriods:
+    """Caller-built SilencePeriod(start=...) objects keep wall time."""
+    
+    def test_mark_activity_closes_wall_clock_period(self):
+        analyzer = SilenceDurationAnalyzer(user_id="u1")
+        start = datetime.utcnow() - timedelta(seconds=30)
+        analyzer.current_silence = SilencePeriod(start=start)
+        analyzer.mark_activity()
+        
+        (period,) = analyzer.silence_periods
+        assert period.duration_seconds == pytest.approx(30, abs=1)
+        assert period.end - start == pytest.approx(
+            timedelta(seconds=30), abs=timedelta(seconds=1)
+        )
+        assert period.classification is SilenceType.PROCESSING
+        assert analyzer.average_silence_duration() == pytest.approx(30, abs=1)
+        assert analyzer.longest_silence() is period
+    
+    def test_short_wall_clock_period_is_not_recorded(self):
+        analyzer = SilenceDurationAnalyzer(user_id="u1")
+        analyzer.current_silence = SilencePeriod(
+            start=datetime.utcnow() - timedelta(seconds=2)
+        )
+        analyzer.mark_activity()
+        assert analyzer.silence_periods == []
+
+
+class TestRecordedPeriods:
+    """silence_periods is a snapshot; aggregates follow mark_activity()."""
+    
+    def _analyzer(self, *seconds_ago):
+        analyzer = SilenceDurationAnalyzer(user_id="u1")
+        for seconds in seconds_ago:
+            analyzer.current_silence = SilencePeriod(
+                start=datetime.utcnow() - timedelta(seconds=seconds)
+            )
+            analyzer.mark_activity()
+        return analyzer
+    
+    def test_returned_list_is_a_copy(self):
+        analyzer = self._analyzer(20, 100)
+        periods = analyzer.silence_periods
+        periods.clear()
+        assert len(analyzer.silence_periods) == 2
+        assert analyzer.longest_silence() is analyzer.silence_periods[1]
+        assert analyzer.silence_by_type()["dissociation"] == 1
+    
+    def test_attribute_cannot_be_replaced(self):
+        analyzer = self._analyzer(20)
+        with pytest.raises(AttributeError):
+            analyzer.silence_periods = []
+
+
+class TestToMetric:
+    """to_metric() serializes the periods as they are now."""
+    
+    def _analyzer(self):
+        analyzer = SilenceDurationAnalyzer(user_id="u1")
+        analyzer.current_silence = SilencePeriod(
+            start=datetime.utcnow() - timedelta(seconds=20)
+        )
+        analyzer.mark_activity()
+        return analyzer
+    
+    def test_edits_to_output_do_not_persist(self):
+        analyzer = self._analyzer()
+        analyzer.to_metric()["silence_periods"][0]["classification"] = "x"
+        assert analyzer.to_metric()["silence_periods"][0][
+            "classification"
+        ] == "processing"
+    
+    def test_reclassified_period_is_reserialized(self):
+        analyzer = self._analyzer()
+        analyzer.to_metric()
+        analyzer.silence_periods[0].classification = SilenceType.OVERWHELM
+        assert analyzer.to_metric()["silence_periods"][0][
+            "classification"
+        ] == "overwhelm"